@@ -0,0 +1,189 @@
+# --- 운세 생성 핫패스 벤치마크 ---
+# MBTI × 별자리 × 띠 × 시간대 × 날짜 전체 공간을 돌면서 함수별 호출 지연 백분위,
+# 호출당 메모리 할당, 처리량을 재서 JSON으로 남긴다. 날씨는 네 가지 상태를 돌려가며
+# 넣으므로 네트워크 없이 돈다.
+#
+#   python -m benchmarks.fortune --out bench.json
+#   python -m benchmarks.fortune --compare bench.json   # 이전 커밋 결과와 비교
+import argparse
+import datetime
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from fortune_engine import (
+    generate_fortune,
+    get_day_type,
+    get_korean_zodiac,
+    get_lunar_date,
+    get_special_days,
+    get_zodiac_sign,
+)
+from fortune_engine.clock import FrozenClock, use_clock
+from fortune_engine.constants import ANIMALS, MBTI_LIST, TIME_SLOTS, WEATHER_CONDITIONS, ZODIAC_SIGNS
+
+BIRTH_FIRST = datetime.date(1920, 1, 1)
+BIRTH_LAST = datetime.date(2010, 12, 31)
+
+
+def _percentile(sorted_values, q):
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summarize(durations_ns, alloc_bytes):
+    durations_ns.sort()
+    alloc_bytes.sort()
+    total_s = sum(durations_ns) / 1e9
+    return {
+        "calls": len(durations_ns),
+        "latency_us": {
+            "mean": round(sum(durations_ns) / len(durations_ns) / 1e3, 3),
+            "p50": round(_percentile(durations_ns, 0.50) / 1e3, 3),
+            "p90": round(_percentile(durations_ns, 0.90) / 1e3, 3),
+            "p99": round(_percentile(durations_ns, 0.99) / 1e3, 3),
+            "max": round(durations_ns[-1] / 1e3, 3),
+        },
+        "throughput_per_s": round(len(durations_ns) / total_s, 1) if total_s else None,
+        "alloc_bytes": {
+            "samples": len(alloc_bytes),
+            "p50": _percentile(alloc_bytes, 0.50),
+            "p99": _percentile(alloc_bytes, 0.99),
+        },
+    }
+
+
+def _measure(fn, cases, alloc_samples):
+    """cases 전체를 돌며 호출별 지연을 재고, 앞쪽 alloc_samples건은 tracemalloc으로 할당량을 잰다"""
+    perf_counter_ns = time.perf_counter_ns
+    durations = []
+    for args in cases:
+        start = perf_counter_ns()
+        fn(*args)
+        durations.append(perf_counter_ns() - start)
+
+    allocs = []
+    tracemalloc.start()
+    try:
+        for args in cases[:alloc_samples]:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn(*args)
+            _, peak = tracemalloc.get_traced_memory()
+            allocs.append(peak - before)
+    finally:
+        tracemalloc.stop()
+    return _summarize(durations, allocs)
+
+
+def _random_birth(rng):
+    return BIRTH_FIRST + datetime.timedelta(days=rng.randrange((BIRTH_LAST - BIRTH_FIRST).days + 1))
+
+
+def build_cases(start, days, seed=0):
+    """함수별 입력 목록 (seed가 같으면 커밋이 달라도 같은 입력)"""
+    rng = random.Random(seed)
+    dates = [start + datetime.timedelta(days=i) for i in range(days)]
+
+    fortune_cases = []
+    for today in dates:
+        for time_slot in TIME_SLOTS:
+            for mbti in MBTI_LIST:
+                for zodiac in ZODIAC_SIGNS:
+                    for animal in ANIMALS:
+                        weather_condition = WEATHER_CONDITIONS[len(fortune_cases) % len(WEATHER_CONDITIONS)]
+                        fortune_cases.append((mbti, zodiac, animal, _random_birth(rng), weather_condition, today, time_slot))
+
+    births = [_random_birth(rng) for _ in range(20000)]
+    year_dates = [start + datetime.timedelta(days=i) for i in range(366 * 2)]
+    return {
+        "generate_fortune": fortune_cases,
+        "get_special_days": [(birth, dates[i % len(dates)]) for i, birth in enumerate(births)],
+        "get_day_type": [(d,) for d in year_dates],
+        "get_lunar_date": [(birth,) for birth in births],
+        "get_korean_zodiac": [(birth,) for birth in births],
+        "get_zodiac_sign": [(birth.day, birth.month) for birth in births],
+    }
+
+
+FUNCTIONS = {
+    "generate_fortune": generate_fortune,
+    "get_special_days": get_special_days,
+    "get_day_type": get_day_type,
+    "get_lunar_date": get_lunar_date,
+    "get_korean_zodiac": get_korean_zodiac,
+    "get_zodiac_sign": get_zodiac_sign,
+}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(start, days, alloc_samples=500, only=None):
+    cases = build_cases(start, days)
+    results = {}
+    for name, fn in FUNCTIONS.items():
+        if only and name not in only:
+            continue
+        results[name] = _measure(fn, cases[name], alloc_samples)
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "start": start.isoformat(),
+        "days": days,
+        "results": results,
+    }
+
+
+def compare(report, baseline):
+    """p50/p99 지연과 처리량을 기준 결과 대비 비율로 출력"""
+    lines = [f"{'function':<20} {'p50 us':>12} {'p99 us':>12} {'calls/s':>14}"]
+    for name, cur in report["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        cells = []
+        for value, old_value in ((cur["latency_us"]["p50"], old["latency_us"]["p50"]),
+                                 (cur["latency_us"]["p99"], old["latency_us"]["p99"]),
+                                 (cur["throughput_per_s"], old["throughput_per_s"])):
+            ratio = f"x{value / old_value:.2f}" if old_value else "-"
+            cells.append(f"{value:.1f} {ratio:>6}")
+        lines.append(f"{name:<20} {cells[0]:>12} {cells[1]:>12} {cells[2]:>14}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="운세 생성 핫패스 벤치마크")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, default=datetime.date(2026, 1, 1), help="첫 날짜 (기본 2026-01-01, 커밋 간 비교를 위해 고정)")
+    parser.add_argument("--days", type=int, default=3, help="generate_fortune을 전체 조합으로 돌릴 일수")
+    parser.add_argument("--alloc-samples", type=int, default=500, help="함수별 할당량을 잴 호출 수")
+    parser.add_argument("--only", nargs="*", choices=sorted(FUNCTIONS), help="일부 함수만 측정")
+    parser.add_argument("--out", help="결과 JSON 경로 (기본: 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    # 시계를 --start 날 아침에 고정 (자정 캐시 갱신 등 시각 의존 동작이 실행 시각에 따라 달라지지 않게)
+    with use_clock(FrozenClock(datetime.datetime.combine(args.start, datetime.time(8)))):
+        report = run(args.start, args.days, args.alloc_samples, args.only)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print(compare(report, json.load(f)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# --- 콜드 스타트 벤치마크 ---
+# 새 파드/새 Streamlit 워커가 첫 화면을 그리기 전까지 드는 import·초기화 시간을 잰다.
+# 시나리오마다 새 인터프리터를 띄워 여러 번 재고(중앙값), 한 번은 -X importtime으로 돌려
+# 모듈별 누적 import 시간 상위 목록과 무거운 의존성(requests/holidays 등)이 올라왔는지 남긴다.
+#
+#   python -m benchmarks.startup --out startup.json
+#   python -m benchmarks.startup --compare startup.json   # 이전 커밋 결과와 비교
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+from benchmarks.fortune import _git_commit
+
+# 첫 화면 전에 올라오면 안 되는 의존성 (실제로 쓸 때 가져온다)
+HEAVY_MODULES = ("requests", "holidays", "korean_lunar_calendar", "dotenv", "http.server", "cProfile")
+
+# 시나리오 이름 → 새 인터프리터에서 실행할 코드
+SCENARIOS = {
+    # 패키지 import만
+    "engine_import": "import fortune_engine",
+    # app.py가 첫 화면까지 하는 일 (Streamlit 자체는 빼고: 엔진 import, 날씨 클라이언트 생성, 카드 계산)
+    "app_first_paint": """
+import datetime
+import fortune_engine
+from fortune_engine import get_korean_zodiac, get_lunar_date, get_zodiac_sign
+from fortune_engine.backends import backend_from_url
+from fortune_engine.cache import FortuneCache
+from fortune_engine.context import set_context_backend
+from fortune_engine.precompute import FortuneTable
+from fortune_engine.render import ReportCache
+from fortune_engine.weather import WeatherClient, WeatherRefresher
+refresher = WeatherRefresher([(58, 126)], WeatherClient(None))
+refresher.get(58, 126)
+birth = datetime.date(1990, 1, 1)
+get_lunar_date(birth), get_zodiac_sign(birth.day, birth.month), get_korean_zodiac(birth)
+FortuneCache(), ReportCache()
+""",
+    # 첫 운세까지 (공휴일 판정에 holidays를 처음 쓰는 시점)
+    "first_fortune": """
+import datetime
+from fortune_engine import generate_fortune
+generate_fortune("INTJ", "물병자리", "말", datetime.date(1990, 1, 1), "맑음", datetime.date(2026, 3, 3), "오전")
+""",
+    # HTTP API 서버 모듈
+    "api_import": "import fortune_engine.api",
+}
+
+_CHILD = """
+import sys, time, json
+start = time.perf_counter()
+exec(compile(sys.argv[1], "<scenario>", "exec"), {"__name__": "__scenario__"})
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1e3, "heavy": [m for m in json.loads(sys.argv[2]) if m in sys.modules]}))
+"""
+
+
+def _child_env():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (root, env.get("PYTHONPATH"))))
+    # 계측/프로파일이 켜진 환경에서 돌려도 같은 조건
+    env.pop("FORTUNE_PROFILE_RATE", None)
+    return env
+
+
+def _run_child(code, importtime=False):
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _CHILD, code, json.dumps(HEAVY_MODULES)]
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=_child_env(), check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 → {모듈: (자체 µs, 누적 µs)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if self_us.isdigit():
+            modules[name] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure(code, repeat, top):
+    """새 인터프리터로 repeat번 실행한 시간 중앙값 + importtime 상위 모듈"""
+    runs = [_run_child(code)[0]["ms"] for _ in range(repeat)]
+    result, stderr = _run_child(code, importtime=True)
+    # 인터프리터 기동(site 등) 때 이미 올라오는 모듈은 빼고 시나리오가 가져온 것만
+    baseline = parse_importtime(_run_child("pass", importtime=True)[1])
+    modules = {name: times for name, times in parse_importtime(stderr).items() if name not in baseline}
+    slowest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    return {
+        "ms": {
+            "median": round(statistics.median(runs), 2),
+            "min": round(min(runs), 2),
+            "max": round(max(runs), 2),
+        },
+        "modules_loaded": len(modules),
+        "heavy_loaded": result["heavy"],
+        "top_cumulative_us": [{"module": name, "self": self_us, "cumulative": cumulative_us} for name, (self_us, cumulative_us) in slowest],
+    }
+
+
+def run(repeat=7, top=15, only=None):
+    results = {}
+    for name, code in SCENARIOS.items():
+        if only and name not in only:
+            continue
+        results[name] = measure(code, repeat, top)
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(report, baseline):
+    """시나리오별 중앙값을 기준 결과 대비 비율로 출력"""
+    lines = [f"{'scenario':<18} {'median ms':>16} {'modules':>14}  heavy"]
+    for name, cur in report["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        value, old_value = cur["ms"]["median"], old["ms"]["median"]
+        ratio = f"x{value / old_value:.2f}" if old_value else "-"
+        lines.append(f"{name:<18} {value:>9.1f} {ratio:>6} {cur['modules_loaded']:>7} ({old['modules_loaded']:>4})  {','.join(cur['heavy_loaded']) or '-'}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="콜드 스타트(import·초기화) 벤치마크")
+    parser.add_argument("--repeat", type=int, default=7, help="시나리오별 새 인터프리터 실행 횟수")
+    parser.add_argument("--top", type=int, default=15, help="누적 import 시간 상위 몇 개 모듈을 남길지")
+    parser.add_argument("--only", nargs="*", choices=sorted(SCENARIOS), help="일부 시나리오만 측정")
+    parser.add_argument("--out", help="결과 JSON 경로 (기본: 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat, args.top, args.only)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print(compare(report, json.load(f)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""오늘의 눈치 레이더 - 템플릿 운세 엔진
+
+Streamlit 없이 import 할 수 있는 독립 패키지.
+app.py와 배치 작업, HTTP API, 벤치마크가 같은 엔진을 공유한다.
+"""
+from . import clock
+from .birth import BirthProfile, get_birth_profile
+from .compact import compact_fortune, expand_fortune
+from .constants import ANIMAL_ICONS, BUSINESS_DISTRICTS, MBTI_LIST, ZODIAC_ICONS
+from .context import DayContext, get_day_context
+from .dates import (
+    get_day_type,
+    get_holiday_name,
+    get_ipchun_date,
+    get_korean_zodiac,
+    get_lunar_date,
+    get_season,
+    get_special_days,
+    get_time_slot,
+    get_today_lunar,
+    get_zodiac_sign,
+    next_time_slot_start,
+    preload_holidays,
+)
+from .engine import fortune_seed, generate_fortune
+from .templates import TEMPLATES
+
+__version__ = "2.0.0"
+
+__all__ = [
+    "ANIMAL_ICONS",
+    "BUSINESS_DISTRICTS",
+    "BirthProfile",
+    "DayContext",
+    "MBTI_LIST",
+    "TEMPLATES",
+    "ZODIAC_ICONS",
+    "clock",
+    "compact_fortune",
+    "expand_fortune",
+    "fortune_seed",
+    "generate_fortune",
+    "get_birth_profile",
+    "get_day_context",
+    "get_day_type",
+    "get_holiday_name",
+    "get_ipchun_date",
+    "get_korean_zodiac",
+    "get_lunar_date",
+    "get_season",
+    "get_special_days",
+    "get_time_slot",
+    "get_today_lunar",
+    "get_zodiac_sign",
+    "next_time_slot_start",
+    "preload_holidays",
+]
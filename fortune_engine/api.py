@@ -0,0 +1,217 @@
+# --- Streamlit 없이 운세를 JSON으로 내주는 HTTP API ---
+# 카카오톡 봇/위젯처럼 브라우저 세션이 필요 없는 클라이언트용.
+# 표준 라이브러리 ThreadingHTTPServer 위에서 keep-alive(HTTP/1.1)로 동작한다.
+#
+#   python -m fortune_engine.api --port 8080
+#   GET /fortune?birth=1990-01-01&mbti=INTJ&district=마곡
+#   GET /healthz
+#   GET /metrics   # Prometheus 텍스트 형식
+import argparse
+import datetime
+import json
+import logging
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from . import clock, metrics, profiling
+from .constants import BUSINESS_DISTRICTS, DISTRICTS_BY_NAME, MBTI_LIST
+from .context import set_context_backend
+from .dates import get_time_slot, preload_holidays
+from .backends import backend_from_url
+from .birth import get_birth_profile
+from .cache import FortuneCache
+from .precompute import FortuneTableFile
+from .weather import FALLBACK_WEATHER, WeatherClient, WeatherRefresher
+
+DEFAULT_DISTRICT = "마곡"
+MAX_BODY_BYTES = 64 * 1024  # POST 본문 상한 (파라미터 세 개면 수백 바이트)
+
+_log = logging.getLogger(__name__)
+
+
+class BadRequest(ValueError):
+    """잘못된 요청 파라미터"""
+
+
+def find_district(name):
+    """업무지구 선택지 이름 또는 짧은 이름 → 업무지구 정보 (없으면 None)"""
+    return DISTRICTS_BY_NAME.get(name) if isinstance(name, str) else None
+
+
+def parse_fortune_params(params):
+    """쿼리/JSON 파라미터 → (생년월일, MBTI, 업무지구 정보)"""
+    try:
+        birth_date = datetime.date.fromisoformat(params["birth"])
+    except KeyError:
+        raise BadRequest("birth 파라미터가 필요합니다 (YYYY-MM-DD)")
+    except (TypeError, ValueError):
+        raise BadRequest("birth는 YYYY-MM-DD 형식이어야 합니다")
+
+    mbti = str(params.get("mbti", "")).upper()
+    if mbti not in MBTI_LIST:
+        raise BadRequest(f"알 수 없는 MBTI: {mbti or '(없음)'}")
+
+    district = params.get("district") or DEFAULT_DISTRICT
+    district_info = find_district(district)
+    if district_info is None:
+        raise BadRequest(f"알 수 없는 업무지구: {district}")
+    return birth_date, mbti, district_info
+
+
+class FortuneService:
+    """요청 하나를 운세 dict로 바꾸는 부분 (HTTP와 분리해서 다른 서버에도 붙일 수 있게)"""
+
+    def __init__(self, refresher=None, table=None, cache=None):
+        self.refresher = refresher
+        self.table = table  # FortuneTableFile (None이면 항상 즉석 생성)
+        self.cache = cache or FortuneCache()
+
+    def weather_for(self, district_info):
+        if self.refresher is None:
+            return FALLBACK_WEATHER
+        return self.refresher.get(district_info["nx"], district_info["ny"])
+
+    def fortune(self, birth_date, mbti, district_info, today=None):
+        # 날짜와 시간대를 같은 시각에서 정한다 (자정/시간대 경계에서 어긋나지 않게)
+        now = clock.now()
+        today = today or now.date()
+        _, _, weather_condition = self.weather_for(district_info)
+        table = self.table.get(today) if self.table is not None else None
+        fortune_fn = table.lookup if table is not None else self.cache.fortune
+        profile = get_birth_profile(birth_date)
+        with profiling.tags(district=district_info["name"]):
+            return fortune_fn(
+                mbti=mbti,
+                zodiac=profile.zodiac,
+                animal=profile.animal,
+                birth_date=birth_date,
+                weather_condition=weather_condition,
+                today=today,
+                time_slot=get_time_slot(now),
+                profile=profile,
+            )
+
+
+class FortuneRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "NunchiRadar"
+    # 헤더와 본문을 따로 쓰므로 Nagle을 끄지 않으면 keep-alive 응답마다 ~40ms 지연
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        # 초당 수천 건 요청마다 stderr에 찍지 않는다
+        pass
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle_fortune(self, params):
+        try:
+            birth_date, mbti, district_info = parse_fortune_params(params)
+        except BadRequest as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        try:
+            with metrics.timer("api_fortune"), profiling.sample("api_fortune", mbti=mbti, district=district_info["name"]) as sample:
+                fortune = self.server.service.fortune(birth_date, mbti, district_info)
+                sample.tag(time_slot=fortune["time_slot"])
+        except Exception:
+            # 연결을 끊지 않고 500으로 답한다 (keep-alive 클라이언트가 원인을 알 수 있게)
+            _log.exception("운세 생성 실패 (mbti=%s, district=%s)", mbti, district_info["name"])
+            metrics.inc("api_error")
+            self._send_json(500, {"error": "운세를 만들지 못했습니다"})
+            return
+        self._send_json(200, fortune)
+
+    def _send_metrics(self):
+        body = metrics.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", metrics.CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/healthz":
+            self._send_json(200, {"status": "ok", "fortune_cache": self.server.service.cache.stats()})
+        elif url.path == "/metrics":
+            self._send_metrics()
+        elif url.path == "/fortune":
+            self._handle_fortune({k: v[-1] for k, v in parse_qs(url.query).items()})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/fortune":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(400, {"error": "Content-Length가 올바르지 않습니다"})
+            self.close_connection = True  # 본문 길이를 모르면 다음 요청 경계도 모른다
+            return
+        if length > MAX_BODY_BYTES:
+            self._send_json(413, {"error": f"본문은 {MAX_BODY_BYTES:,}바이트까지입니다"})
+            self.close_connection = True  # 읽지 않은 본문이 다음 요청으로 읽히지 않게
+            return
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "JSON 본문을 읽을 수 없습니다"})
+            return
+        if not isinstance(params, dict):
+            self._send_json(400, {"error": "JSON 객체가 필요합니다"})
+            return
+        self._handle_fortune(params)
+
+
+def make_server(host, port, service):
+    server = ThreadingHTTPServer((host, port), FortuneRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="운세 JSON API 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--cache-url", default=os.getenv("FORTUNE_CACHE_URL"), help="레플리카 공유 캐시 (sqlite:///경로 또는 redis://호스트:포트/DB)")
+    parser.add_argument("--table", default=os.getenv("FORTUNE_TABLE_PATH", "fortune_table.bin"), help="사전 계산 테이블 경로 (없으면 즉석 생성)")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    backend = backend_from_url(args.cache_url)
+    set_context_backend(backend)
+    # 첫 요청이 holidays import와 holidays.KR() 생성을 기다리지 않게 올해 ±1년을 미리 채운다
+    year = clock.today().year
+    preload_holidays(range(year - 1, year + 2))
+    points = [(d["nx"], d["ny"]) for d in BUSINESS_DISTRICTS.values()]
+    refresher = WeatherRefresher(points, WeatherClient(os.getenv("WEATHER_API_KEY")), backend).start()
+    table = FortuneTableFile(args.table)
+
+    server = make_server(args.host, args.port, FortuneService(refresher, table, FortuneCache(backend=backend)))
+    print(f"운세 API: http://{args.host}:{args.port}/fortune")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        refresher.stop()
+
+
+if __name__ == "__main__":
+    main()
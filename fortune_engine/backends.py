@@ -0,0 +1,217 @@
+# --- 여러 프로세스/레플리카가 같이 쓰는 캐시 저장소 ---
+# 날씨 관측값, 압축 운세, 날짜 컨텍스트를 bytes로 넣고 꺼내는 작은 인터페이스.
+# 한 레플리카가 계산/수신한 값을 다른 레플리카가 바로 쓰고, 새로 뜬 파드도 처음부터 캐시를 탄다.
+#
+#   FORTUNE_CACHE_URL=sqlite:///var/cache/nunchi.db   # 같은 호스트의 워커끼리 (파일 + mmap)
+#   FORTUNE_CACHE_URL=redis://cache:6379/0             # 여러 호스트 (Redis 프로토콜)
+#
+# 저장소: get(key) → bytes 또는 None, set(key, value, ttl=None), close()
+# 저장소 오류는 예외 대신 캐시 미스로 취급한다 (캐시 때문에 운세 응답이 실패하지 않게).
+import socket
+import sqlite3
+import threading
+from urllib.parse import unquote, urlparse
+
+from . import clock
+from .weather import CircuitBreaker
+
+
+class CacheBackendError(Exception):
+    """저장소 응답 오류"""
+
+
+class MemoryBackend:
+    """프로세스 안 dict (공유는 안 되지만 인터페이스는 같다)"""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and clock.timestamp() >= expires_at:
+            with self._lock:
+                self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = clock.timestamp() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (bytes(value), expires_at)
+
+    def close(self):
+        self._data.clear()
+
+
+class SQLiteBackend:
+    """SQLite 파일 하나 (WAL + mmap 읽기, 같은 호스트의 여러 프로세스가 공유)"""
+
+    PURGE_EVERY = 1000  # set 이만큼마다 만료된 줄을 지운다
+
+    def __init__(self, path, mmap_size=64 << 20, timeout=1.0):
+        self.path = path
+        self.mmap_size = mmap_size
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+        conn = self._conn()
+        conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)")
+        conn.commit()
+
+    def _conn(self):
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않는다)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        try:
+            row = self._conn().execute(
+                "SELECT value FROM cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, clock.timestamp()),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key, value, ttl=None):
+        now = clock.timestamp()
+        expires_at = now + ttl if ttl is not None else None
+        try:
+            conn = self._conn()
+            conn.execute("INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)", (key, bytes(value), expires_at))
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                conn.execute("DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RedisBackend:
+    """Redis 프로토콜(RESP2) 클라이언트 (GET / SET PX만 사용, 외부 패키지 없음)
+
+    연결 하나를 잠금으로 나눠 쓰고, 끊기면 다음 요청에서 다시 연결한다.
+    연속으로 실패하면 잠시 요청을 보내지 않는다 (매 요청마다 연결 타임아웃을 기다리지 않게).
+    """
+
+    def __init__(self, host="localhost", port=6379, db=0, password=None, timeout=0.2, breaker=None):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker(failure_threshold=3, reset_timeout=5.0)
+        self._sock = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock, self._reader = sock, sock.makefile("rb")
+        if self.password:
+            self._call("AUTH", self.password)
+        if self.db:
+            self._call("SELECT", str(self.db))
+
+    def _disconnect(self):
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = self._reader = None
+
+    def _call(self, *args):
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, (bytes, bytearray)) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("연결이 끊김")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body
+        if kind == b"-":
+            raise CacheBackendError(body.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("연결이 끊김")
+            return data[:-2]
+        if kind == b"*":
+            length = int(body)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise CacheBackendError(f"알 수 없는 응답: {line!r}")
+
+    def _request(self, *args):
+        if not self.breaker.allow():
+            return None
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                reply = self._call(*args)
+            except (OSError, CacheBackendError, ValueError):
+                self._disconnect()
+                self.breaker.record_failure()
+                return None
+        self.breaker.record_success()
+        return reply
+
+    def get(self, key):
+        reply = self._request("GET", key)
+        return reply if isinstance(reply, bytes) else None
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            self._request("SET", key, value)
+        else:
+            self._request("SET", key, value, "PX", max(1, int(ttl * 1000)))
+
+    def close(self):
+        with self._lock:
+            self._disconnect()
+
+
+def backend_from_url(url):
+    """memory:// / sqlite:///경로 / redis://[:비밀번호@]호스트:포트/DB → 저장소 (빈 값이면 None)"""
+    if not url:
+        return None
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        return MemoryBackend()
+    if parsed.scheme == "sqlite":
+        path = unquote(parsed.netloc + parsed.path)
+        return SQLiteBackend(path or ":memory:")
+    if parsed.scheme == "redis":
+        db = int(parsed.path.lstrip("/") or 0)
+        password = unquote(parsed.password) if parsed.password else None
+        return RedisBackend(parsed.hostname or "localhost", parsed.port or 6379, db, password)
+    raise ValueError(f"지원하지 않는 캐시 저장소: {url}")
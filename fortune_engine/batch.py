@@ -0,0 +1,166 @@
+# --- 대량 발송용 배치 운세 생성 (NumPy) ---
+# 아침 푸시처럼 같은 날짜·시간대로 많은 사용자 운세를 만들 때 쓴다.
+# 날짜만으로 정해지는 부분과 (MBTI × 별자리 × 띠 × 날씨) 조합별 템플릿 인덱스 표는 한 번만 만들고,
+# 사용자별 별자리/띠/음력 생일은 배열 연산으로 구해서 표에서 한꺼번에 꺼낸다.
+# 결과는 generate_fortune과 같다 ('오늘의 변수'만 배치 RNG로 따로 뽑음).
+import datetime
+
+import numpy as np
+
+from .constants import ANIMALS, DISTRICTS_BY_NAME, MBTI_LIST, TIME_SLOTS, WEATHER_CONDITIONS, ZODIAC_SIGNS
+from .dates import get_ipchun_date, get_korean_zodiac, get_time_slot, get_zodiac_sign
+from .engine import fortune_pools, render_fortune
+from .lunar import FIRST_DATE, LAST_DATE, lunar_table, solar_to_lunar
+from .precompute import ROW_WIDTH, day_info, slot_rows
+from .templates import TEMPLATES
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# 월*100+일 → 별자리 코드
+_ZODIAC_BY_MD = np.zeros(1232, dtype=np.int64)
+for _month in range(1, 13):
+    for _day in range(1, 32):
+        _ZODIAC_BY_MD[_month * 100 + _day] = ZODIAC_SIGNS.index(get_zodiac_sign(_day, _month))
+
+# 연도 → 입춘 (월*100+일), 띠 코드 (연도 % 12)
+_IPCHUN_FIRST_YEAR, _IPCHUN_LAST_YEAR = 1900, 2100
+_IPCHUN_MD = np.array([d.month * 100 + d.day for d in map(get_ipchun_date, range(_IPCHUN_FIRST_YEAR, _IPCHUN_LAST_YEAR + 1))], dtype=np.int64)
+# 2004 % 12 == 0 이므로 2004+i년 연말의 띠가 (연도 % 12 == i)의 띠
+_ANIMAL_BY_MOD12 = np.array([ANIMALS.index(get_korean_zodiac(datetime.date(2004 + i, 12, 31))) for i in range(12)], dtype=np.int64)
+
+
+def _codes(values, choices, name, default=None):
+    lookup = {v: i for i, v in enumerate(choices)}
+    try:
+        return np.array([lookup[v] if default is None else lookup.get(v, default) for v in values], dtype=np.int64)
+    except KeyError as e:
+        raise ValueError(f"알 수 없는 {name}: {e.args[0]}") from None
+
+
+def _as_days(birth_dates):
+    """생년월일 목록(date 또는 datetime64) → datetime64[D] 배열"""
+    return np.asarray(birth_dates, dtype="datetime64[D]")
+
+
+def zodiac_codes(birth_days):
+    """datetime64[D] 배열 → 별자리 코드 배열"""
+    months = birth_days.astype("datetime64[M]")
+    md = (months.astype(np.int64) % 12 + 1) * 100 + (birth_days - months).astype(np.int64) + 1
+    return _ZODIAC_BY_MD[md]
+
+
+def animal_codes(birth_days):
+    """datetime64[D] 배열 → 띠 코드 배열 (입춘 전이면 전년도 띠)"""
+    years = birth_days.astype("datetime64[Y]").astype(np.int64) + 1970
+    if years.size and (years.min() < _IPCHUN_FIRST_YEAR or years.max() > _IPCHUN_LAST_YEAR):
+        return np.array([ANIMALS.index(get_korean_zodiac(d)) for d in birth_days.tolist()], dtype=np.int64)
+    months = birth_days.astype("datetime64[M]")
+    md = (months.astype(np.int64) % 12 + 1) * 100 + (birth_days - months).astype(np.int64) + 1
+    target_years = years - (md < _IPCHUN_MD[years - _IPCHUN_FIRST_YEAR])
+    return _ANIMAL_BY_MOD12[target_years % 12]
+
+
+def lunar_month_days(birth_days):
+    """datetime64[D] 배열 → (음력 월 배열, 음력 일 배열)"""
+    offsets = birth_days.astype(np.int64) + _EPOCH_ORDINAL - FIRST_DATE.toordinal()
+    in_range = (offsets >= 0) & (offsets <= LAST_DATE.toordinal() - FIRST_DATE.toordinal())
+    packed = np.zeros(offsets.shape, dtype=np.int64)
+    packed[in_range] = np.asarray(lunar_table(), dtype=np.uint32)[offsets[in_range]]
+    months, days = (packed >> 6) & 0xF, (packed >> 1) & 0x1F
+    for i in np.flatnonzero(~in_range):
+        _, months[i], days[i], _ = solar_to_lunar(birth_days[i].item())
+    return months, days
+
+
+class FortuneBatch:
+    """배치 결과 (인덱스 배열로 들고 있다가 꺼낼 때 dict로 조립)"""
+
+    def __init__(self, today, time_slot, info, birth_days, mbti, zodiac, animal, weather, picks, solar_birthday, lunar_birthday, random_var):
+        self.today = today
+        self.time_slot = time_slot
+        self.info = info
+        self.birth_days = birth_days
+        self.mbti = mbti
+        self.zodiac = zodiac
+        self.animal = animal
+        self.weather = weather
+        self.picks = picks
+        self.solar_birthday = solar_birthday
+        self.lunar_birthday = lunar_birthday
+        self.random_var = random_var
+
+    def __len__(self):
+        return len(self.picks)
+
+    def __getitem__(self, i):
+        info = self.info
+        mbti, zodiac, animal = MBTI_LIST[self.mbti[i]], ZODIAC_SIGNS[self.zodiac[i]], ANIMALS[self.animal[i]]
+        special_days = []
+        if self.solar_birthday[i]:
+            special_days.append("양력생일")
+        if self.lunar_birthday[i]:
+            special_days.append("음력생일")
+        special_days += info["specials"]
+        pools = fortune_pools(mbti, zodiac, animal, WEATHER_CONDITIONS[self.weather[i]], info["day_type"], info["season"], self.time_slot)
+        return render_fortune(pools, self.picks[i].tolist(), zodiac, animal, self.time_slot, info["day_type"], info["holiday_name"],
+                              special_days, random_var=TEMPLATES["random_variable"][self.random_var[i]])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+def _district_name(district):
+    """업무지구 선택지 이름/짧은 이름 → 짧은 이름 (모르는 이름은 ValueError)"""
+    info = DISTRICTS_BY_NAME.get(district) if isinstance(district, str) else None
+    if info is None:
+        raise ValueError(f"알 수 없는 업무지구: {district}")
+    return info["name"]
+
+
+def generate_fortunes(birth_dates, mbtis, districts, today, time_slot=None, weather=None, table=None, seed=None):
+    """여러 사용자의 운세를 한 번에 생성
+
+    birth_dates / mbtis / districts는 같은 길이의 배열 (업무지구는 "강남/테헤란로" 또는 "강남", 모르는 이름은 ValueError).
+    weather는 {업무지구: 날씨 상태} (날씨가 없는 업무지구는 '흐림'),
+    table은 사전 계산 테이블(FortuneTable)로 오늘이 들어 있으면 조합표를 다시 계산하지 않는다.
+    """
+    if time_slot is None:
+        time_slot = get_time_slot()
+    if time_slot not in TIME_SLOTS:
+        raise ValueError(f"알 수 없는 시간대: {time_slot}")
+    birth_days = _as_days(birth_dates)
+    if not (len(birth_days) == len(mbtis) == len(districts)):
+        raise ValueError("birth_dates, mbtis, districts 길이가 다릅니다")
+
+    # 날짜·시간대 공통 부분 (한 번만)
+    info = day_info(today)
+    if table is not None and today in table:
+        rows = table.slot_rows(today, time_slot)
+    else:
+        rows = slot_rows(today, info, time_slot)
+    slot_picks = np.frombuffer(rows, dtype=np.uint8).reshape(-1, ROW_WIDTH)
+
+    # 사용자별 코드 (배열 연산)
+    mbti = _codes([str(m).upper() for m in mbtis], MBTI_LIST, "MBTI")
+    zodiac = zodiac_codes(birth_days)
+    animal = animal_codes(birth_days)
+    # 업무지구는 API/bulk와 같이 선택지 이름과 짧은 이름 둘 다 받고, 짧은 이름 기준으로 날씨를 찾는다
+    weather = {_district_name(d): condition for d, condition in (weather or {}).items()}
+    district_weather = {d: weather.get(_district_name(d), "흐림") for d in set(districts)}
+    weather_codes = _codes([district_weather[d] for d in districts], WEATHER_CONDITIONS, "날씨", default=WEATHER_CONDITIONS.index("흐림"))
+
+    # 조합 행 인덱스 → 템플릿 인덱스 (precompute의 행 배치와 같은 순서)
+    row = ((mbti * len(ZODIAC_SIGNS) + zodiac) * len(ANIMALS) + animal) * len(WEATHER_CONDITIONS) + weather_codes
+    picks = slot_picks[row]
+
+    # 생일 체크
+    months = birth_days.astype("datetime64[M]")
+    solar_birthday = ((months.astype(np.int64) % 12 + 1) == today.month) & ((birth_days - months).astype(np.int64) + 1 == today.day)
+    lunar_months, lunar_days = lunar_month_days(birth_days)
+    today_month, today_day = info["lunar"]
+    lunar_birthday = (lunar_months == today_month) & (lunar_days == today_day)
+
+    random_var = np.random.default_rng(seed).integers(len(TEMPLATES["random_variable"]), size=len(birth_days))
+    return FortuneBatch(today, time_slot, info, birth_days, mbti, zodiac, animal, weather_codes, picks,
+                        solar_birthday, lunar_birthday, random_var)
@@ -0,0 +1,37 @@
+# --- 생년월일 프로필 ---
+# 음력 생일/별자리/띠/생일 비교용 음력 (월, 일)은 생년월일만으로 정해지므로
+# 생년월일당 한 번만 계산해서 카드 표시와 운세 생성(생일 특수일)이 같이 쓴다.
+import functools
+
+from .dates import get_korean_zodiac, get_lunar_date, get_today_lunar, get_zodiac_sign
+
+_MAX_PROFILES = 4096  # 동시에 쓰는 사용자 생년월일 수보다 넉넉하게
+
+
+class BirthProfile:
+    """생년월일 하나에서 나오는 값 (만든 뒤에는 바꾸지 않는다)"""
+
+    __slots__ = ("birth_date", "lunar", "lunar_md", "zodiac", "animal")
+
+    def __init__(self, birth_date, lunar, lunar_md, zodiac, animal):
+        self.birth_date = birth_date
+        self.lunar = lunar
+        self.lunar_md = tuple(lunar_md)
+        self.zodiac = zodiac
+        self.animal = animal
+
+    @classmethod
+    def build(cls, birth_date):
+        return cls(
+            birth_date,
+            get_lunar_date(birth_date),
+            get_today_lunar(birth_date),
+            get_zodiac_sign(birth_date.day, birth_date.month),
+            get_korean_zodiac(birth_date),
+        )
+
+
+@functools.lru_cache(maxsize=_MAX_PROFILES)
+def get_birth_profile(birth_date):
+    """생년월일 → BirthProfile (프로세스 전역 LRU)"""
+    return BirthProfile.build(birth_date)
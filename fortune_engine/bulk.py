@@ -0,0 +1,160 @@
+# --- 멀티코어 대량 운세 생성 CLI ---
+# CSV/JSONL 사용자 목록을 청크로 나눠 프로세스 풀에서 generate_fortune으로 생성하고,
+# 입력 순서대로 JSONL에 바로바로 쓴다. 동시에 처리 중인 청크 수를 제한해서 메모리는 일정하고,
+# 중간에 끊겨도 --resume으로 이미 쓴 줄 다음부터 이어서 돈다.
+#
+#   python -m fortune_engine.bulk users.csv --out fortunes.jsonl --date 2026-03-02 --time-slot 출근길
+#   python -m fortune_engine.bulk users.csv --out fortunes.jsonl --date 2026-03-02 --time-slot 출근길 --resume
+#
+# 입력 컬럼: id(선택), birth(YYYY-MM-DD), mbti, district(선택, 기본 마곡)
+import argparse
+import csv
+import datetime
+import itertools
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from . import clock
+from .api import BadRequest, find_district, parse_fortune_params
+from .birth import get_birth_profile
+from .constants import TIME_SLOTS, WEATHER_CONDITIONS
+from .engine import generate_fortune
+
+
+class InvalidRow:
+    """읽을 수 없는 입력 줄 (출력에도 {id, error} 한 줄을 써서 입력과 줄 수를 맞춘다)"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def read_users(path):
+    """CSV 또는 JSONL(.jsonl/.ndjson) 사용자 목록을 한 줄씩 읽는다 (깨진 JSON 줄은 InvalidRow)"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield InvalidRow(f"JSON을 읽을 수 없습니다: {e}")
+        else:
+            yield from csv.DictReader(f)
+
+
+def _chunks(iterable, size):
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def _generate_chunk(start_index, rows, today, time_slot, weather):
+    """워커 프로세스: 사용자 청크 → JSONL 줄 목록 (직렬화까지 워커에서 처리)"""
+    lines = []
+    for offset, row in enumerate(rows):
+        if not isinstance(row, dict):
+            error = row.error if isinstance(row, InvalidRow) else "JSON 객체가 필요합니다"
+            lines.append(json.dumps({"id": str(start_index + offset), "error": error}, ensure_ascii=False))
+            continue
+        user_id = row.get("id") or str(start_index + offset)
+        try:
+            birth_date, mbti, district_info = parse_fortune_params(row)
+        except BadRequest as e:
+            lines.append(json.dumps({"id": user_id, "error": str(e)}, ensure_ascii=False))
+            continue
+        profile = get_birth_profile(birth_date)
+        fortune = generate_fortune(
+            mbti=mbti,
+            zodiac=profile.zodiac,
+            animal=profile.animal,
+            birth_date=birth_date,
+            weather_condition=weather.get(district_info["name"], "흐림"),
+            today=today,
+            time_slot=time_slot,
+            profile=profile,
+        )
+        lines.append(json.dumps({"id": user_id, "fortune": fortune}, ensure_ascii=False))
+    return lines
+
+
+def completed_lines(path):
+    """이미 다 쓴 줄 수 (마지막에 덜 쓴 줄이 있으면 잘라낸다)"""
+    if not os.path.exists(path):
+        return 0
+    with open(path, "rb+") as f:
+        count = 0
+        last_newline = 0
+        position = 0
+        while block := f.read(1 << 20):
+            count += block.count(b"\n")
+            index = block.rfind(b"\n")
+            if index >= 0:
+                last_newline = position + index + 1
+            position += len(block)
+        if last_newline != position:
+            f.truncate(last_newline)
+    return count
+
+
+def run(input_path, output_path, today, time_slot, weather=None, workers=None, chunk_size=1000, resume=False):
+    """대량 생성 실행, 이번에 쓴 줄 수 반환 (weather는 {업무지구 짧은 이름: 날씨})"""
+    weather = weather or {}
+    skip = completed_lines(output_path) if resume else 0
+    users = itertools.islice(read_users(input_path), skip, None)
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+
+    written = 0
+    with open(output_path, "a" if resume else "w", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+
+        def drain_one():
+            nonlocal written
+            lines = pending.popleft().result()
+            out.write("\n".join(lines) + "\n")
+            out.flush()
+            written += len(lines)
+
+        start_index = skip
+        for chunk in _chunks(users, chunk_size):
+            pending.append(pool.submit(_generate_chunk, start_index, chunk, today, time_slot, weather))
+            start_index += len(chunk)
+            if len(pending) >= max_pending:
+                drain_one()
+        while pending:
+            drain_one()
+    return written
+
+
+def _weather_arg(value):
+    district, _, condition = value.partition("=")
+    district_info = find_district(district)
+    if district_info is None:
+        raise argparse.ArgumentTypeError(f"알 수 없는 업무지구: {district}")
+    if condition not in WEATHER_CONDITIONS:
+        raise argparse.ArgumentTypeError(f"날씨는 {'/'.join(WEATHER_CONDITIONS)} 중 하나: {value}")
+    return district_info["name"], condition
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="사용자 목록으로 운세를 대량 생성해 JSONL로 저장")
+    parser.add_argument("input", help="사용자 목록 (CSV 또는 JSONL)")
+    parser.add_argument("--out", required=True, help="출력 JSONL 경로")
+    parser.add_argument("--date", type=datetime.date.fromisoformat, default=None, help="운세 날짜 (기본: 오늘)")
+    parser.add_argument("--time-slot", choices=TIME_SLOTS, required=True)
+    parser.add_argument("--weather", type=_weather_arg, action="append", default=[], metavar="지역=날씨", help="업무지구별 날씨 (예: 마곡=비, 없으면 흐림)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--resume", action="store_true", help="출력 파일에 이미 쓴 줄 다음부터 이어서 생성")
+    args = parser.parse_args(argv)
+
+    today = args.date or clock.today()
+    written = run(args.input, args.out, today, args.time_slot, dict(args.weather), args.workers, args.chunk_size, args.resume)
+    print(f"{args.out}: {written:,}건 생성")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# --- 운세 결과 캐시 ---
+# 같은 날짜·시간대에 (MBTI, 별자리, 띠, 날씨, 생일 여부)가 같으면 '오늘의 변수'를 빼고는 항상 같은 운세가 나온다.
+# 그 결정적인 부분을 압축 운세(34바이트)로 LRU에 담아두고, 오늘의 변수만 요청마다 새로 뽑아 얹는다.
+# 시간대가 바뀌는 시각(clock 기준)에 통째로 비운다.
+# backend(backends 모듈의 저장소)를 주면 로컬 미스일 때 레플리카 공유 캐시를 먼저 본다.
+import random
+import threading
+from collections import OrderedDict
+
+from . import clock, metrics
+from .compact import (
+    ANIMAL_CODES,
+    MBTI_CODES,
+    PACKED_SIZE,
+    RANDOM_VAR_IDS,
+    TIME_SLOT_CODES,
+    WEATHER_CODES,
+    ZODIAC_CODES,
+    compact_fingerprint,
+    compact_fortune,
+    expand_fortune,
+)
+from .context import get_day_context
+from .dates import get_time_slot, next_time_slot_start
+
+# 오늘의 변수용 (요청마다 random.Random()을 만들면 urandom 시딩에 ~17µs가 든다)
+_random_var_rng = random.Random()
+
+
+class FortuneCache:
+    """결정적 운세 LRU 캐시 (스레드 안전, hits/misses 카운터)"""
+
+    def __init__(self, maxsize=65536, backend=None):
+        self.maxsize = maxsize
+        self.backend = backend
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        # 템플릿/코드 순서가 바뀌면 다른 키 (배포 중 구버전 레플리카와 섞이지 않게)
+        self._key_prefix = f"nr:fortune:{compact_fingerprint()[:12]}"
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._expires_at = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _expire(self):
+        """시간대 경계를 지나면 비우고 다음 경계를 잡는다 (_lock 안에서 호출)"""
+        self._entries.clear()
+        self._expires_at = next_time_slot_start(clock.now()).timestamp()
+
+    def fortune(self, mbti, zodiac, animal, birth_date, weather_condition, today, time_slot=None, random_rng=None, profile=None):
+        """generate_fortune과 같은 결과 (결정적인 부분은 캐시에서)"""
+        if time_slot is None:
+            time_slot = get_time_slot()
+        context = get_day_context(today)
+        key = (today, time_slot, mbti, zodiac, animal, weather_condition, tuple(context.birthday_flags(birth_date, profile)))
+
+        with self._lock:
+            if clock.timestamp() >= self._expires_at:
+                self._expire()
+            packed = self._entries.get(key)
+            if packed is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        metrics.inc("fortune_cache_miss" if packed is None else "fortune_cache_hit")
+        if packed is None:
+            shared_key = self._shared_key(key) if self.backend is not None else None
+            if shared_key is not None:
+                packed = self.backend.get(shared_key)
+                if packed is not None and len(packed) == PACKED_SIZE:
+                    self.shared_hits += 1
+                    metrics.inc("fortune_cache_shared_hit")
+                else:
+                    packed = None
+            if packed is None:
+                # 오늘의 변수는 꺼낼 때마다 새로 뽑으므로 캐시에는 0으로
+                packed = compact_fortune(mbti, zodiac, animal, birth_date, weather_condition, today, time_slot,
+                                         context=context, random_var=0, profile=profile)
+                if shared_key is not None:
+                    self.backend.set(shared_key, packed, max(1.0, self._expires_at - clock.timestamp()))
+            with self._lock:
+                self._entries[key] = packed
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        random_var = (random_rng or _random_var_rng).randrange(len(RANDOM_VAR_IDS))
+        return expand_fortune(packed, context.holiday_name, random_var)
+
+    def _shared_key(self, key):
+        today, time_slot, mbti, zodiac, animal, weather_condition, birthday_flags = key
+        weather = WEATHER_CODES.get(weather_condition, WEATHER_CODES["흐림"])
+        flags = ("양력생일" in birthday_flags) | ("음력생일" in birthday_flags) << 1
+        return (f"{self._key_prefix}:{today:%Y%m%d}:{TIME_SLOT_CODES[time_slot]}:{MBTI_CODES[mbti]}:"
+                f"{ZODIAC_CODES[zodiac]}:{ANIMAL_CODES[animal]}:{weather}:{flags}")
+
+    def stats(self):
+        return {"hits": self.hits, "shared_hits": self.shared_hits, "misses": self.misses,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.shared_hits = self.misses = 0
+
@@ -0,0 +1,105 @@
+# --- 한국 시간 시계 ---
+# 날짜/시간대/캐시 갱신 경계를 모두 이 시계 하나로 계산한다.
+# 서버가 UTC로 돌아도 Asia/Seoul 기준으로 동작하고,
+# 테스트·벤치마크에서는 FrozenClock으로 바꿔 끼워 시각을 고정하거나 앞으로 돌릴 수 있다.
+#
+#   with use_clock(FrozenClock(datetime.datetime(2026, 3, 2, 8, 59))) as clock:
+#       get_time_slot()                       # "출근길"
+#       clock.advance(minutes=1)
+#       get_time_slot()                       # "오전"
+import contextlib
+import datetime
+import threading
+import time
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    KST = ZoneInfo("Asia/Seoul")
+except (ImportError, ZoneInfoNotFoundError):
+    # tzdata가 없는 컨테이너: 1988년 이후 서머타임이 없으므로 고정 +9시간과 같다
+    KST = datetime.timezone(datetime.timedelta(hours=9), "KST")
+
+
+class SystemClock:
+    """실제 시각 (Asia/Seoul)"""
+
+    def now(self):
+        return datetime.datetime.now(KST)
+
+    def today(self):
+        return self.now().date()
+
+    def timestamp(self):
+        return time.time()
+
+
+class FrozenClock:
+    """멈춰 있는 시계 (advance/set으로만 움직인다)
+
+    naive datetime은 한국 시간으로 본다.
+    """
+
+    def __init__(self, now):
+        self._lock = threading.Lock()
+        self.set(now)
+
+    def set(self, now):
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=KST)
+        with self._lock:
+            self._now = now.astimezone(KST)
+
+    def advance(self, delta=None, **kwargs):
+        """delta(timedelta) 또는 timedelta 인자(minutes=5 등)만큼 앞으로"""
+        delta = delta or datetime.timedelta(**kwargs)
+        with self._lock:
+            self._now = (self._now + delta).astimezone(KST)
+        return self._now
+
+    def now(self):
+        return self._now
+
+    def today(self):
+        return self._now.date()
+
+    def timestamp(self):
+        return self._now.timestamp()
+
+
+_clock = SystemClock()
+
+
+def get_clock():
+    return _clock
+
+
+def set_clock(clock):
+    """프로세스 전역 시계 교체, 이전 시계 반환"""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+@contextlib.contextmanager
+def use_clock(clock):
+    """with 블록 안에서만 시계 교체"""
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
+
+
+def now():
+    """현재 한국 시각 (aware datetime)"""
+    return _clock.now()
+
+
+def today():
+    """현재 한국 날짜"""
+    return _clock.today()
+
+
+def timestamp():
+    """현재 epoch 초 (캐시 만료 비교용)"""
+    return _clock.timestamp()
@@ -0,0 +1,185 @@
+# --- 압축 템플릿 저장소 ---
+# 템플릿 문장을 모두 UTF-8 blob 하나 + 오프셋 배열로 모으고 (같은 문장은 한 번만),
+# MBTI/별자리/띠/날씨/요일 유형/계절/시간대는 작은 정수 코드로 바꾼다.
+# 운세 하나는 코드와 템플릿 인덱스를 담은 34바이트 bytes(PACKED_SIZE)로 들고 있다가 보여줄 때만 dict로 펼친다.
+#
+# 압축 운세 형식 (모두 uint8):
+#   [0] MBTI [1] 별자리 [2] 띠 [3] 날씨 [4] 요일 유형 [5] 계절 [6] 시간대
+#   [7] 오늘의 변수 [8:10] 특수일 비트 (SPECIAL_DAY_KEYS 순서, little endian)
+#   [10:] PICK_FIELDS 순서의 템플릿 인덱스
+import functools
+import hashlib
+import itertools
+import random
+from array import array
+
+from . import profiling
+from .constants import ANIMALS, DAY_TYPES, MBTI_LIST, SEASONS, TIME_SLOTS, WEATHER_CONDITIONS, ZODIAC_SIGNS
+from .context import get_day_context
+from .dates import get_time_slot
+from .engine import PICK_FIELDS, SPECIAL_DAY_KEYS, assemble_fortune, fortune_seed, pick_fortune
+from .precompute import template_fingerprint
+from .templates import TEMPLATES
+
+HEADER_SIZE = 10
+PACKED_SIZE = HEADER_SIZE + len(PICK_FIELDS)
+
+MBTI_CODES = {v: i for i, v in enumerate(MBTI_LIST)}
+ZODIAC_CODES = {v: i for i, v in enumerate(ZODIAC_SIGNS)}
+ANIMAL_CODES = {v: i for i, v in enumerate(ANIMALS)}
+WEATHER_CODES = {v: i for i, v in enumerate(WEATHER_CONDITIONS)}
+DAY_TYPE_CODES = {v: i for i, v in enumerate(DAY_TYPES)}
+SEASON_CODES = {v: i for i, v in enumerate(SEASONS)}
+TIME_SLOT_CODES = {v: i for i, v in enumerate(TIME_SLOTS)}
+_SPECIAL_BITS = {key: 1 << i for i, key in enumerate(SPECIAL_DAY_KEYS)}
+
+# 압축 운세 헤더 위치 → 코드 순서
+_AXES = (MBTI_LIST, ZODIAC_SIGNS, ANIMALS, WEATHER_CONDITIONS, DAY_TYPES, SEASONS, TIME_SLOTS)
+_MBTI, _ZODIAC, _ANIMAL, _WEATHER, _DAY_TYPE, _SEASON, _TIME_SLOT = range(len(_AXES))
+
+# PICK_FIELDS 순서대로 (템플릿 이름, 후보 목록을 고르는 헤더 위치 또는 특수일 키)
+_POOL_SOURCES = (
+    ("mbti_fortune", _MBTI),
+    ("animal_energy", _ANIMAL),
+    ("day_type_morning", _DAY_TYPE),
+    ("zodiac_morning", _ZODIAC),
+    ("day_type_afternoon", _DAY_TYPE),
+    ("zodiac_afternoon", _ZODIAC),
+    ("day_type_evening", _DAY_TYPE),
+    ("mbti_warning", _MBTI),
+    ("animal_warning", _ANIMAL),
+    ("weather_lunch", _WEATHER),
+    ("lucky_items", None),
+    ("season_vibe", _SEASON),
+    ("time_intro", _TIME_SLOT),
+    *(("special_day", key) for key in SPECIAL_DAY_KEYS),
+    ("office_tips", None),
+    ("lunch_menu", None),
+)
+
+
+class TemplateStore:
+    """문자열 ID → 문장 (UTF-8 blob 하나 + uint32 오프셋 배열)
+
+    한 번 푼 문장은 ID별로 기억해서 같은 str 객체를 돌려준다 (템플릿 수만큼만, 운세 수와 무관).
+    """
+
+    def __init__(self, texts):
+        encoded = [text.encode("utf-8") for text in texts]
+        self.blob = b"".join(encoded)
+        self.offsets = array("I", itertools.accumulate(map(len, encoded), initial=0))
+        self._decoded = [None] * len(encoded)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def text(self, string_id):
+        text = self._decoded[string_id]
+        if text is None:
+            text = self._decoded[string_id] = self.blob[self.offsets[string_id]:self.offsets[string_id + 1]].decode("utf-8")
+        return text
+
+    @property
+    def nbytes(self):
+        return len(self.blob) + self.offsets.itemsize * len(self.offsets)
+
+
+def _compile():
+    """TEMPLATES → (TemplateStore, 항목별 후보 ID 배열, 오늘의 변수 ID 배열)"""
+    ids = {}
+
+    def intern(pool):
+        return array("H", (ids.setdefault(text, len(ids)) for text in pool))
+
+    pool_ids = []
+    for name, axis in _POOL_SOURCES:
+        source = TEMPLATES[name]
+        if axis is None:
+            pool_ids.append((intern(source),))
+        elif isinstance(axis, str):
+            pool_ids.append((intern(source[axis]),))
+        else:
+            # 템플릿에 없는 날씨는 fortune_pools와 같이 '흐림' 후보로
+            pool_ids.append(tuple(intern(source.get(key, source.get("흐림"))) for key in _AXES[axis]))
+    random_var_ids = intern(TEMPLATES["random_variable"])
+    return TemplateStore(ids), tuple(pool_ids), random_var_ids
+
+
+STORE, POOL_IDS, RANDOM_VAR_IDS = _compile()
+_POOL_AXES = tuple(axis if isinstance(axis, int) else None for _, axis in _POOL_SOURCES)
+
+
+@functools.cache
+def compact_fingerprint():
+    """템플릿 지문 + 압축 코드 순서 (압축 운세를 프로세스 밖에 저장할 때 키에 넣는다)"""
+    h = hashlib.blake2b(template_fingerprint().encode("ascii"), digest_size=16)
+    h.update(repr(_AXES).encode("utf-8"))
+    return h.hexdigest()
+
+
+def pack_fortune(mbti, zodiac, animal, weather_condition, day_type, season, time_slot, picks, special_days, random_var):
+    """운세 구성 요소 → 압축 운세 bytes (random_var는 오늘의 변수 인덱스)"""
+    special_mask = 0
+    for key in special_days:
+        special_mask |= _SPECIAL_BITS.get(key, 0)
+    header = (
+        MBTI_CODES[mbti],
+        ZODIAC_CODES[zodiac],
+        ANIMAL_CODES[animal],
+        WEATHER_CODES.get(weather_condition, WEATHER_CODES["흐림"]),
+        DAY_TYPE_CODES[day_type],
+        SEASON_CODES[season],
+        TIME_SLOT_CODES[time_slot],
+        random_var,
+        special_mask & 0xFF,
+        special_mask >> 8,
+    )
+    return bytes(header) + bytes(picks)
+
+
+@profiling.sampled("generate_fortune")
+def compact_fortune(mbti, zodiac, animal, birth_date, weather_condition, today, time_slot=None, random_rng=None, context=None, random_var=None, profile=None):
+    """generate_fortune과 같은 운세를 압축 운세 bytes로 (펼치면 같은 dict)
+
+    random_var(오늘의 변수 인덱스)를 주면 random_rng로 뽑지 않고 그 값을 넣는다.
+    캐시 미스 때 실제로 운세를 만드는 곳이라 프로파일 샘플은 generate_fortune과 같은 종류로 모은다.
+    """
+    if time_slot is None:
+        time_slot = get_time_slot()
+    if context is None:
+        context = get_day_context(today)
+    header = (MBTI_CODES[mbti], ZODIAC_CODES[zodiac], ANIMAL_CODES[animal],
+              WEATHER_CODES.get(weather_condition, WEATHER_CODES["흐림"]),
+              DAY_TYPE_CODES[context.day_type], SEASON_CODES[context.season], TIME_SLOT_CODES[time_slot])
+    pools = [ids[0] if axis is None else ids[header[axis]] for ids, axis in zip(POOL_IDS, _POOL_AXES)]
+    picks = pick_fortune(pools, fortune_seed(today, mbti, zodiac, animal, time_slot))
+    if random_var is None:
+        random_var = (random_rng or random.Random()).randrange(len(RANDOM_VAR_IDS))
+    return pack_fortune(mbti, zodiac, animal, weather_condition, context.day_type, context.season, time_slot,
+                        picks, context.special_days(birth_date, profile), random_var)
+
+
+def expand_fortune(packed, holiday_name=None, random_var=None):
+    """압축 운세 bytes → 운세 dict
+
+    holiday_name은 공휴일이면 그 날의 DayContext.holiday_name,
+    random_var(오늘의 변수 인덱스)를 주면 압축 운세에 든 값 대신 쓴다.
+    """
+    header = packed[:HEADER_SIZE]
+    if random_var is None:
+        random_var = header[7]
+    texts = []
+    for ids, axis, pick in zip(POOL_IDS, _POOL_AXES, packed[HEADER_SIZE:]):
+        texts.append(STORE.text((ids[0] if axis is None else ids[header[axis]])[pick]))
+    special_mask = header[8] | header[9] << 8
+    special_days = [key for key, bit in _SPECIAL_BITS.items() if special_mask & bit]
+    return assemble_fortune(
+        texts,
+        ZODIAC_SIGNS[header[_ZODIAC]],
+        ANIMALS[header[_ANIMAL]],
+        TIME_SLOTS[header[_TIME_SLOT]],
+        DAY_TYPES[header[_DAY_TYPE]],
+        holiday_name,
+        special_days,
+        random_var=STORE.text(RANDOM_VAR_IDS[random_var]),
+    )
@@ -0,0 +1,28 @@
+# --- 업무지구 설정 ---
+BUSINESS_DISTRICTS = {
+    "종로/을지로": {"nx": 60, "ny": 127, "name": "종로"},
+    "여의도": {"nx": 58, "ny": 126, "name": "여의도"},
+    "강남/테헤란로": {"nx": 61, "ny": 126, "name": "강남"},
+    "판교": {"nx": 62, "ny": 123, "name": "판교"},
+    "마곡": {"nx": 58, "ny": 125, "name": "마곡"},
+}
+# "강남/테헤란로" 같은 선택지 이름과 "강남" 같은 짧은 이름 → 업무지구 정보
+DISTRICTS_BY_NAME = {
+    **BUSINESS_DISTRICTS,
+    **{info["name"]: info for info in BUSINESS_DISTRICTS.values()},
+}
+
+# --- 입력 선택지 ---
+MBTI_LIST = ["ISTJ", "ISFJ", "INFJ", "INTJ", "ISTP", "ISFP", "INFP", "INTP", "ESTP", "ESFP", "ENFP", "ENTP", "ESTJ", "ESFJ", "ENFJ", "ENTJ"]
+
+# --- 아이콘 데이터 ---
+ZODIAC_ICONS = {"물병자리": "🏺", "물고기자리": "🐟", "양자리": "🐏", "황소자리": "🐂", "쌍둥이자리": "👯", "게자리": "🦀", "사자자리": "🦁", "처녀자리": "🧚", "천칭자리": "⚖️", "전갈자리": "🦂", "사수자리": "🏹", "염소자리": "🐐"}
+ANIMAL_ICONS = {"쥐": "🐭", "소": "🐮", "호랑이": "🐯", "토끼": "🐰", "용": "🐲", "뱀": "🐍", "말": "🐴", "양": "🐑", "원숭이": "🐵", "닭": "🐔", "개": "🐶", "돼지": "🐷"}
+
+# --- 코드 순서 (사전 계산 테이블 인덱스로 사용하므로 순서 고정) ---
+ZODIAC_SIGNS = tuple(ZODIAC_ICONS)
+ANIMALS = tuple(ANIMAL_ICONS)
+TIME_SLOTS = ("출근길", "오전", "점심", "오후", "퇴근후")
+WEATHER_CONDITIONS = ("맑음", "흐림", "비", "눈")
+DAY_TYPES = ("월요일", "평일", "금요일", "연휴전날", "주말", "공휴일")
+SEASONS = ("신년", "봄", "초여름", "장마", "한여름", "가을", "연말")
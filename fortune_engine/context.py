@@ -0,0 +1,127 @@
+# --- 날짜별 공통 컨텍스트 ---
+# 요일 유형/공휴일/계절/날짜 특수일/오늘 음력은 날짜만으로 정해지므로
+# 날짜당 한 번만 계산해서 프로세스 전체가 같이 쓴다. 한국 시간 자정이 지나면 지난 날짜는 버린다.
+import datetime
+import json
+import threading
+
+from . import clock, metrics
+from .birth import get_birth_profile
+from .dates import get_day_specials, get_day_type, get_season, get_today_lunar, holidays_version
+
+_MAX_CONTEXTS = 64  # 사전 계산/대량 생성에서 여러 날짜를 돌 때의 상한
+SHARED_TTL_SECONDS = 2 * 86400
+
+
+class DayContext:
+    """날짜 하나의 공통 부분 (만든 뒤에는 바꾸지 않는다)"""
+
+    __slots__ = ("date", "day_type", "holiday_name", "season", "specials", "lunar")
+
+    def __init__(self, date, day_type, holiday_name, season, specials, lunar):
+        self.date = date
+        self.day_type = day_type
+        self.holiday_name = holiday_name
+        self.season = season
+        self.specials = tuple(specials)
+        self.lunar = tuple(lunar)
+
+    @classmethod
+    def build(cls, date):
+        day_type, holiday_name = get_day_type(date)
+        return cls(date, day_type, holiday_name, get_season(date), get_day_specials(date), get_today_lunar(date))
+
+    def to_bytes(self):
+        """공유 캐시 저장용 JSON"""
+        return json.dumps([self.date.isoformat(), self.day_type, self.holiday_name, self.season,
+                           self.specials, self.lunar], ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data):
+        date, day_type, holiday_name, season, specials, lunar = json.loads(data)
+        return cls(datetime.date.fromisoformat(date), day_type, holiday_name, season, specials, lunar)
+
+    def birthday_flags(self, birth_date, profile=None):
+        """사용자별로 남는 특수일 (양력/음력 생일, profile은 birth_date의 BirthProfile)"""
+        if profile is None:
+            profile = get_birth_profile(birth_date)
+        special = []
+        if birth_date.month == self.date.month and birth_date.day == self.date.day:
+            special.append("양력생일")
+        if profile.lunar_md == self.lunar:
+            special.append("음력생일")
+        return special
+
+    def special_days(self, birth_date, profile=None):
+        """get_special_days(birth_date, date)와 같은 목록"""
+        return self.birthday_flags(birth_date, profile) + list(self.specials)
+
+
+_contexts = {}
+_contexts_lock = threading.Lock()
+_expires_at = 0.0  # 다음 한국 시간 자정 (epoch 초)
+_backend = None  # 레플리카 공유 캐시 (backends 모듈의 저장소)
+
+
+def set_context_backend(backend):
+    """공유 캐시 저장소 지정 (None이면 프로세스 안에서만)"""
+    global _backend
+    _backend = backend
+
+
+def _shared_key(date):
+    # 공휴일 데이터 버전이 바뀌면 다른 키
+    return f"nr:day:{holidays_version()}:{date.isoformat()}"
+
+
+def _load_context(date):
+    """공유 캐시에 있으면 꺼내고, 없으면 계산해서 넣는다"""
+    backend = _backend
+    if backend is None:
+        with metrics.timer("day_context_build"):
+            return DayContext.build(date)
+    data = backend.get(_shared_key(date))
+    if data is not None:
+        try:
+            context = DayContext.from_bytes(data)
+            metrics.inc("day_context_shared_hit")
+            return context
+        except (ValueError, TypeError):
+            pass
+    with metrics.timer("day_context_build"):
+        context = DayContext.build(date)
+    backend.set(_shared_key(date), context.to_bytes(), SHARED_TTL_SECONDS)
+    return context
+
+
+def _drop_past_days():
+    """자정이 지났으면 한국 시간 기준 어제까지의 컨텍스트를 버린다 (_contexts_lock 안에서 호출)"""
+    global _expires_at
+    today = clock.today()
+    for day in [day for day in _contexts if day < today]:
+        del _contexts[day]
+    midnight = datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time(), clock.KST)
+    _expires_at = midnight.timestamp()
+
+
+def get_day_context(date):
+    """날짜 → DayContext (프로세스 전역 캐시)"""
+    context = _contexts.get(date)
+    now = clock.timestamp()
+    if context is not None and now < _expires_at:
+        return context
+    with _contexts_lock:
+        if now >= _expires_at:
+            _drop_past_days()
+        context = _contexts.get(date)
+        if context is None:
+            if len(_contexts) >= _MAX_CONTEXTS:
+                _contexts.clear()
+            context = _contexts[date] = _load_context(date)
+    return context
+
+
+def clear_day_contexts():
+    """캐시 비우기 (공휴일 데이터를 바꿨을 때 등)"""
+    with _contexts_lock:
+        _contexts.clear()
@@ -0,0 +1,253 @@
+# --- 날짜/달력 유틸리티 ---
+import datetime
+import functools
+import threading
+
+from . import clock, metrics
+from .lunar import solar_to_lunar
+
+def get_lunar_date(date_obj):
+    year, month, day, is_leap = solar_to_lunar(date_obj)
+    date_str = "%04d-%02d-%02d" % (year, month, day)
+    if is_leap:
+        date_str += " Intercalation"
+    return date_str
+
+def get_today_lunar(today=None):
+    """오늘(또는 지정한 날짜)을 음력 (월, 일)로 변환"""
+    if today is None:
+        today = clock.today()
+    _, month, day, _ = solar_to_lunar(today)
+    return (month, day)
+
+# --- 별자리 / 띠 조회 테이블 ---
+# 별자리: (시작 월, 시작 일, 이름) 경계에서 월*32+일 → 별자리 표를 만들어 인덱스 한 번으로 찾는다.
+_ZODIAC_STARTS = (
+    (1, 20, "물병자리"), (2, 19, "물고기자리"), (3, 21, "양자리"), (4, 20, "황소자리"),
+    (5, 21, "쌍둥이자리"), (6, 22, "게자리"), (7, 23, "사자자리"), (8, 23, "처녀자리"),
+    (9, 23, "천칭자리"), (10, 23, "전갈자리"), (11, 23, "사수자리"), (12, 25, "염소자리"),
+)
+
+def _build_zodiac_table():
+    table = []
+    sign = "염소자리"
+    starts = {(month, day): name for month, day, name in _ZODIAC_STARTS}
+    for md in range(13 * 32):
+        sign = starts.get(divmod(md, 32), sign)
+        table.append(sign)
+    return tuple(table)
+
+_ZODIAC_BY_MD = _build_zodiac_table()
+
+def get_zodiac_sign(day, month):
+    return _ZODIAC_BY_MD[month * 32 + day]
+
+# 입춘 (태양 시황경 315°) 한국 표준시 기준 2월 며칠인지, 1920년부터 한 글자씩.
+# ephem으로 계산 (1954-03-21 ~ 1961-08-09는 UTC+8:30), 한국천문연구원 발표 시각과 분 단위로 맞는다.
+IPCHUN_FIRST_YEAR, IPCHUN_LAST_YEAR = 1920, 2100
+_IPCHUN_FEB_DAYS = (
+    "5445544554455445544554455445544554445444544454445444544454445444544444444444444444444444444444444"
+    "444434443444344434443444344434443444344433443344334433443344334433443344333433343334"
+)
+_IPCHUN_DAY = tuple(int(c) for c in _IPCHUN_FEB_DAYS)
+
+IPCHUN_FALLBACK_DAY = 4  # 테이블 범위 밖 연도는 2월 4일로 근사
+
+def _ipchun_day(year):
+    if IPCHUN_FIRST_YEAR <= year <= IPCHUN_LAST_YEAR:
+        return _IPCHUN_DAY[year - IPCHUN_FIRST_YEAR]
+    return IPCHUN_FALLBACK_DAY
+
+def get_ipchun_date(year):
+    return datetime.date(year, 2, _ipchun_day(year))
+
+# 연도 % 12 → 띠
+KOREAN_ZODIAC_BY_MOD12 = ("원숭이", "닭", "개", "돼지", "쥐", "소", "호랑이", "토끼", "용", "뱀", "말", "양")
+
+def get_korean_zodiac(date_obj):
+    """띠 (입춘 전이면 전년도 띠)"""
+    year, month = date_obj.year, date_obj.month
+    if month == 1:
+        year -= 1
+    elif month == 2 and date_obj.day < _ipchun_day(year):
+        year -= 1
+    return KOREAN_ZODIAC_BY_MOD12[year % 12]
+
+# --- 공휴일 인덱스 (프로세스 전역, 연도별로 한 번만 생성) ---
+_HOLIDAY_YEARS = {}
+_holiday_lock = threading.Lock()
+
+def holidays_version():
+    """holidays 패키지 버전 (공휴일 데이터가 바뀌었는지 구분용)"""
+    import holidays
+    return holidays.__version__
+
+def _holidays_in_year(year):
+    """연도 → {날짜: 공휴일 이름} (holidays.KR()는 연도당 한 번만 만든다)
+
+    holidays는 나라별 모듈까지 읽느라 import만 수십 ms라 처음 공휴일을 찾을 때 가져온다.
+    """
+    names = _HOLIDAY_YEARS.get(year)
+    if names is None:
+        with _holiday_lock:
+            names = _HOLIDAY_YEARS.get(year)
+            if names is None:
+                import holidays
+                with metrics.timer("holidays_kr"):
+                    names = dict(holidays.KR(years=year))
+                _HOLIDAY_YEARS[year] = names
+    return names
+
+def preload_holidays(years):
+    """서버 기동 시 필요한 연도 범위를 미리 채워둔다"""
+    for year in years:
+        _holidays_in_year(year)
+
+def get_holiday_name(date_obj):
+    """공휴일이면 이름, 아니면 None"""
+    return _holidays_in_year(date_obj.year).get(date_obj)
+
+@functools.lru_cache(maxsize=1024)
+def classify_day(date_obj):
+    """(공휴일 이름, 연휴 전날 여부) - get_day_type / get_day_specials 공용"""
+    holiday_name = get_holiday_name(date_obj)
+    if holiday_name is not None:
+        return holiday_name, False
+    
+    # 연휴 전날 체크 (평일이고 내일이 공휴일이거나 주말)
+    tomorrow = date_obj + datetime.timedelta(days=1)
+    is_eve = date_obj.weekday() < 5 and (tomorrow.weekday() >= 5 or get_holiday_name(tomorrow) is not None)
+    return None, is_eve
+
+def get_day_type(date_obj):
+    """요일 유형 반환: 월요일/금요일/평일/주말/공휴일/연휴전날"""
+    holiday_name, is_eve = classify_day(date_obj)
+    
+    # 공휴일 체크
+    if holiday_name is not None:
+        return "공휴일", holiday_name
+    
+    # 연휴 전날 체크 (내일이 공휴일이거나 주말)
+    if is_eve:
+        return "연휴전날", None
+    
+    # 주말 체크
+    if date_obj.weekday() >= 5:
+        return "주말", None
+    
+    # 월요일/금요일 특별 취급
+    if date_obj.weekday() == 0:
+        return "월요일", None
+    elif date_obj.weekday() == 4:
+        return "금요일", None
+    
+    return "평일", None
+
+# 시간대가 바뀌는 시각 (캐시 갱신 경계)
+TIME_SLOT_START_HOURS = (6, 9, 12, 14, 18)
+
+def get_time_slot(now=None):
+    """현재(또는 now 시각의) 한국 시간 기준 시간대 반환"""
+    hour = (now or clock.now()).hour
+    if 6 <= hour < 9:
+        return "출근길"
+    elif 9 <= hour < 12:
+        return "오전"
+    elif 12 <= hour < 14:
+        return "점심"
+    elif 14 <= hour < 18:
+        return "오후"
+    else:
+        return "퇴근후"
+
+def next_time_slot_start(now=None):
+    """now 다음으로 시간대가 바뀌는 시각 (자정을 넘으면 다음 날 06시)"""
+    now = now or clock.now()
+    for hour in TIME_SLOT_START_HOURS:
+        if now.hour < hour:
+            return now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    tomorrow = now + datetime.timedelta(days=1)
+    return tomorrow.replace(hour=TIME_SLOT_START_HOURS[0], minute=0, second=0, microsecond=0)
+
+def get_season(date_obj):
+    """계절/시즌 반환"""
+    month = date_obj.month
+    day = date_obj.day
+    
+    # 연초 (1월 1-7일)
+    if month == 1 and day <= 7:
+        return "신년"
+    # 연말 (12월 20-31일)
+    elif month == 12 and day >= 20:
+        return "연말"
+    # 봄 (3-5월)
+    elif 3 <= month <= 5:
+        return "봄"
+    # 장마 (6월 중순 - 7월 중순)
+    elif (month == 6 and day >= 15) or (month == 7 and day <= 20):
+        return "장마"
+    # 초여름 (6월 초)
+    elif month == 6 and day < 15:
+        return "초여름"
+    # 한여름 (7월 중순 - 8월)
+    elif (month == 7 and day > 20) or month == 8:
+        return "한여름"
+    # 가을 (9-11월)
+    elif 9 <= month <= 11:
+        return "가을"
+    # 기본
+    else:
+        return "봄"
+
+def get_birthday_flags(birth_date, today):
+    """사용자별 특수일 (양력/음력 생일) 체크"""
+    special = []
+    
+    # 양력 생일
+    if birth_date.month == today.month and birth_date.day == today.day:
+        special.append("양력생일")
+    
+    # 음력 생일 체크 (윤달 생일은 월/일만 비교)
+    if get_today_lunar(birth_date) == get_today_lunar(today):
+        special.append("음력생일")
+    
+    return special
+
+def get_day_specials(today):
+    """날짜만으로 정해지는 특수일 체크 (공휴일/연휴전날/월초/월말/분기말/연초/연말)"""
+    special = []
+    holiday_name, is_eve = classify_day(today)
+    
+    # 공휴일
+    if holiday_name is not None:
+        special.append("공휴일")
+    
+    # 연휴 전날
+    if is_eve:
+        special.append("연휴전날")
+    
+    # 월초 (1-3일)
+    if today.day <= 3:
+        special.append("월초")
+    
+    # 월말 (28-31일)
+    if today.day >= 28:
+        special.append("월말")
+    
+    # 분기말 (3, 6, 9, 12월의 마지막 주)
+    if today.month in [3, 6, 9, 12] and today.day >= 25:
+        special.append("분기말")
+    
+    # 연초 (1월 1-7일)
+    if today.month == 1 and today.day <= 7:
+        special.append("연초")
+    
+    # 연말 (12월 20-31일)
+    if today.month == 12 and today.day >= 20:
+        special.append("연말")
+    
+    return special
+
+def get_special_days(birth_date, today):
+    """특수일 체크"""
+    return get_birthday_flags(birth_date, today) + get_day_specials(today)
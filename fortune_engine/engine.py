@@ -0,0 +1,176 @@
+# --- 운세 생성 엔진 ---
+import hashlib
+import random
+
+from . import metrics, profiling
+from .context import get_day_context
+from .dates import get_time_slot
+from .templates import TEMPLATES
+
+# 시드용 BLAKE2b 키 (바꾸면 모든 운세 결과가 바뀌므로 고정)
+SEED_KEY = b"nunchi-radar/v2"
+
+# 특수일 메시지는 해당 여부와 상관없이 키 순서대로 모두 뽑아서
+# 생일 여부가 달라도 뒤따르는 뽑기 결과가 밀리지 않게 한다.
+SPECIAL_DAY_KEYS = tuple(TEMPLATES["special_day"])
+
+# 시드 RNG로 뽑는 항목 순서 (picks[i] ↔ PICK_FIELDS[i])
+PICK_FIELDS = (
+    "mbti_fortune",
+    "animal_energy",
+    "morning_day",
+    "morning_zodiac",
+    "afternoon_day",
+    "afternoon_zodiac",
+    "evening",
+    "mbti_warning",
+    "animal_warning",
+    "lunch",
+    "lucky_item",
+    "season_vibe",
+    "time_intro",
+    *(f"special:{key}" for key in SPECIAL_DAY_KEYS),
+    "office_tip",
+    "lunch_menu",
+)
+_SPECIAL_OFFSET = PICK_FIELDS.index(f"special:{SPECIAL_DAY_KEYS[0]}")
+
+
+def fortune_seed(today, mbti, zodiac, animal, time_slot):
+    """입력 조합 → 프로세스/워커와 무관하게 항상 같은 64bit 시드
+
+    내장 hash()는 프로세스마다 솔트가 달라지므로 키 있는 BLAKE2b 다이제스트를 쓴다.
+    """
+    key = f"{today.strftime('%Y-%m-%d')}-{mbti}-{zodiac}-{animal}-{time_slot}".encode("utf-8")
+    digest = hashlib.blake2b(key, digest_size=8, key=SEED_KEY).digest()
+    return int.from_bytes(digest, "big")
+
+
+def fortune_pools(mbti, zodiac, animal, weather_condition, day_type, season, time_slot):
+    """PICK_FIELDS 순서대로 각 항목의 후보 템플릿 목록"""
+    return (
+        TEMPLATES["mbti_fortune"][mbti],
+        TEMPLATES["animal_energy"][animal],
+        TEMPLATES["day_type_morning"][day_type],
+        TEMPLATES["zodiac_morning"][zodiac],
+        TEMPLATES["day_type_afternoon"][day_type],
+        TEMPLATES["zodiac_afternoon"][zodiac],
+        TEMPLATES["day_type_evening"][day_type],
+        TEMPLATES["mbti_warning"][mbti],
+        TEMPLATES["animal_warning"][animal],
+        TEMPLATES["weather_lunch"].get(weather_condition, TEMPLATES["weather_lunch"]["흐림"]),
+        TEMPLATES["lucky_items"],
+        TEMPLATES["season_vibe"][season],
+        TEMPLATES["time_intro"][time_slot],
+        *(TEMPLATES["special_day"][key] for key in SPECIAL_DAY_KEYS),
+        TEMPLATES["office_tips"],
+        TEMPLATES["lunch_menu"],
+    )
+
+
+def pick_fortune(pools, seed):
+    """시드 RNG로 각 후보 목록의 인덱스를 뽑는다 (rng.choice와 같은 난수 소비)"""
+    rng = random.Random(seed)
+    return tuple(rng.randrange(len(pool)) for pool in pools)
+
+
+def render_fortune(pools, picks, zodiac, animal, time_slot, day_type, holiday_name, special_days, random_rng=None, random_var=None):
+    """뽑힌 인덱스 → 운세 dict 조립
+
+    '오늘의 변수'는 random_var로 직접 넘기지 않으면 random_rng(생략 시 새 random.Random())로 매번 새로 뽑는다.
+    """
+    texts = [pool[i] for pool, i in zip(pools, picks)]
+    return assemble_fortune(texts, zodiac, animal, time_slot, day_type, holiday_name, special_days, random_rng, random_var)
+
+
+def assemble_fortune(texts, zodiac, animal, time_slot, day_type, holiday_name, special_days, random_rng=None, random_var=None):
+    """PICK_FIELDS 순서의 템플릿 문장 목록 → 운세 dict"""
+    (mbti_fortune, animal_energy, morning_day, morning_zodiac, afternoon_day, afternoon_zodiac,
+     evening_tip, mbti_warning, animal_warning, lunch_tip, lucky_item, season_vibe, time_intro) = texts[:_SPECIAL_OFFSET]
+    office_tip, lunch_menu = texts[-2:]
+
+    # 띠×별자리 궁합
+    compat_key = (animal, zodiac)
+    compatibility = TEMPLATES["compatibility"].get(compat_key, ("보통", "균형 잡힌 하루"))
+    compat_level, compat_comment = compatibility
+
+    # 1. 한줄운세 (MBTI 기본 + 띠 기운 + 궁합 보정)
+    if compat_level == "좋음":
+        main_fortune = f"{mbti_fortune}, {animal_energy}"
+    elif compat_level == "주의":
+        main_fortune = f"{mbti_fortune} (단, 오늘은 신중하게)"
+    else:
+        main_fortune = mbti_fortune
+
+    # 5. 주의보 (MBTI + 띠 + 궁합)
+    if compat_level == "주의":
+        warning = f"{mbti_warning}. 특히 오늘은 {compat_comment}"
+    else:
+        warning = f"{mbti_warning}. 또한 {animal_warning}"
+
+    # 7. 행운템
+    lucky_reason = TEMPLATES["lucky_item_reason"][animal].format(animal=animal)
+
+    # 9. 오늘의 변수 (완전 랜덤, 시드 RNG와 분리)
+    if random_var is None:
+        random_var = (random_rng or random.Random()).choice(TEMPLATES["random_variable"])
+
+    # 11. 특수일 메시지
+    special_messages = []
+    for sp in special_days:
+        if sp in TEMPLATES["special_day"]:
+            special_messages.append(texts[_SPECIAL_OFFSET + SPECIAL_DAY_KEYS.index(sp)])
+
+    return {
+        "main": main_fortune,
+        "morning_day": morning_day,
+        "morning_zodiac": morning_zodiac,
+        "afternoon_day": afternoon_day,
+        "afternoon_zodiac": afternoon_zodiac,
+        "evening": evening_tip,
+        "warning": warning,
+        "lunch": lunch_tip,
+        "lucky_item": lucky_item,
+        "lucky_reason": lucky_reason,
+        "season_vibe": season_vibe,
+        "random_var": random_var,
+        "time_intro": time_intro,
+        "time_slot": time_slot,
+        "day_type": day_type,
+        "holiday_name": holiday_name,
+        "compatibility": (compat_level, compat_comment),
+        "special_days": special_days,
+        "special_messages": special_messages,
+        "office_tip": office_tip,
+        "lunch_menu": lunch_menu,
+    }
+
+
+@metrics.timed("generate_fortune")
+@profiling.sampled("generate_fortune")
+def generate_fortune(mbti, zodiac, animal, birth_date, weather_condition, today, time_slot=None, random_rng=None, context=None, profile=None):
+    """템플릿 기반 운세 생성
+
+    Streamlit에 의존하지 않는 순수 함수라 배치 작업/API/벤치마크에서도 그대로 쓸 수 있다.
+    time_slot을 생략하면 현재 시각 기준 시간대를 사용한다.
+    context(DayContext)를 생략하면 today의 공유 컨텍스트를 쓰므로 사용자별로는 생일 체크와 템플릿 뽑기만 남는다.
+    profile(BirthProfile)을 주면 생일 체크에 그 음력 생일을 쓴다 (생략 시 생년월일별 공유 캐시).
+
+    전역 random 상태는 건드리지 않는다. 고정 결과는 호출마다 만드는 시드 RNG로,
+    '오늘의 변수'는 random_rng(생략 시 새 random.Random())로 뽑으므로 스레드에서 동시에 불러도 안전하다.
+    """
+    if time_slot is None:
+        time_slot = get_time_slot()
+
+    # 요일 유형 / 계절 / 날짜 특수일 (날짜당 한 번 계산된 컨텍스트)
+    if context is None:
+        context = get_day_context(today)
+
+    # 특수일 (생일만 사용자별)
+    special_days = context.special_days(birth_date, profile)
+
+    # 시드 설정 (같은 날 + 같은 조합 = 같은 결과)
+    pools = fortune_pools(mbti, zodiac, animal, weather_condition, context.day_type, context.season, time_slot)
+    picks = pick_fortune(pools, fortune_seed(today, mbti, zodiac, animal, time_slot))
+
+    return render_fortune(pools, picks, zodiac, animal, time_slot, context.day_type, context.holiday_name, special_days, random_rng)
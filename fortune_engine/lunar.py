@@ -0,0 +1,122 @@
+# --- 양력 → 음력 변환 테이블 ---
+# date_input 범위(1920~2050)의 모든 날짜를 미리 변환해 uint32 배열로 저장해두고
+# mmap으로 열어 (날짜 서수 - 시작 서수) 인덱스 한 번으로 변환한다.
+#
+#   python -m fortune_engine.lunar build    # data/lunar_1920_2050.bin 재생성
+#   python -m fortune_engine.lunar verify   # korean_lunar_calendar와 전 구간 비교
+#
+# 파일 형식: MAGIC(8) + 시작 서수(uint32) + 일수(uint32) + 일수 × uint32 (little endian)
+# 값 = 음력 연도 << 10 | 월 << 6 | 일 << 1 | 윤달 여부
+import datetime
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+
+from . import metrics
+
+MAGIC = b"NRLUNAR1"
+FIRST_DATE = datetime.date(1920, 1, 1)
+LAST_DATE = datetime.date(2050, 12, 31)
+LUNAR_TABLE_PATH = os.path.join(os.path.dirname(__file__), "data", "lunar_1920_2050.bin")
+
+_HEADER = struct.Struct("<8sII")
+_table = None
+_table_lock = threading.Lock()
+
+
+def _pack(year, month, day, is_leap):
+    return year << 10 | month << 6 | day << 1 | int(is_leap)
+
+
+def _unpack(value):
+    return value >> 10, (value >> 6) & 0xF, (value >> 1) & 0x1F, bool(value & 1)
+
+
+def _convert(date_obj):
+    """korean_lunar_calendar로 직접 변환 (테이블 범위 밖 / 테이블 생성용)"""
+    from korean_lunar_calendar import KoreanLunarCalendar
+    cal = KoreanLunarCalendar()
+    cal.setSolarDate(date_obj.year, date_obj.month, date_obj.day)
+    return cal.lunarYear, cal.lunarMonth, cal.lunarDay, bool(cal.isIntercalation)
+
+
+def _load_table(path=LUNAR_TABLE_PATH):
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, first_ordinal, count = _HEADER.unpack_from(mm)
+    if magic != MAGIC or first_ordinal != FIRST_DATE.toordinal() or count != LAST_DATE.toordinal() - first_ordinal + 1:
+        raise ValueError(f"음력 테이블 형식이 아님: {path}")
+    if sys.byteorder == "little":
+        return memoryview(mm)[_HEADER.size:].cast("I")
+    values = array("I", mm[_HEADER.size:])
+    values.byteswap()
+    return values
+
+
+def lunar_table():
+    """FIRST_DATE부터 하루 단위 uint32 배열 (배치 처리에서 배열 연산용)"""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                _table = _load_table()
+    return _table
+
+
+def solar_to_lunar(date_obj):
+    """양력 날짜 → (음력 연, 월, 일, 윤달 여부)"""
+    if FIRST_DATE <= date_obj <= LAST_DATE:
+        return _unpack(lunar_table()[date_obj.toordinal() - FIRST_DATE.toordinal()])
+    with metrics.timer("lunar_convert_fallback"):
+        return _convert(date_obj)
+
+
+def build_lunar_table(path=LUNAR_TABLE_PATH):
+    """korean_lunar_calendar로 전 구간을 변환해 테이블 파일 생성 (1분 가량 걸림)"""
+    count = LAST_DATE.toordinal() - FIRST_DATE.toordinal() + 1
+    values = array("I", (_pack(*_convert(FIRST_DATE + datetime.timedelta(days=i))) for i in range(count)))
+    if sys.byteorder != "little":
+        values.byteswap()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FIRST_DATE.toordinal(), count))
+        f.write(values.tobytes())
+    return path
+
+
+def verify_lunar_table(path=LUNAR_TABLE_PATH):
+    """테이블과 korean_lunar_calendar 결과가 전 구간에서 같은지 확인, 다른 날짜 목록 반환"""
+    table = _load_table(path)
+    mismatches = []
+    for i in range(len(table)):
+        date_obj = FIRST_DATE + datetime.timedelta(days=i)
+        if _unpack(table[i]) != _convert(date_obj):
+            mismatches.append(date_obj)
+    return mismatches
+
+
+def main(argv=None):
+    import argparse  # CLI에서만 (패키지 import 시간)
+
+    parser = argparse.ArgumentParser(description="양력 → 음력 변환 테이블 관리")
+    parser.add_argument("command", choices=["build", "verify"])
+    parser.add_argument("--path", default=LUNAR_TABLE_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build_lunar_table(args.path)
+        print(f"{args.path}: {FIRST_DATE} ~ {LAST_DATE}")
+        return 0
+    mismatches = verify_lunar_table(args.path)
+    if mismatches:
+        print(f"불일치 {len(mismatches)}건: {', '.join(map(str, mismatches[:10]))}")
+        return 1
+    print(f"{FIRST_DATE} ~ {LAST_DATE} 전 구간 일치")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+# --- 핫패스 계측 (타이머 / 카운터 / 히스토그램) ---
+# 단계별 소요 시간을 메모리 안 히스토그램으로 모으고 Prometheus 텍스트 형식으로 내보낸다.
+#
+#   with metrics.timer("weather"):
+#       ...
+#   metrics.inc("fortune_cache_hit")
+#
+#   FORTUNE_METRICS=0          # 끄기 (timer는 공용 no-op, inc는 바로 반환)
+#   FORTUNE_METRICS_PORT=9108  # Streamlit 앱에서 127.0.0.1:9108/metrics 로 노출 (API 서버는 자체 /metrics)
+import bisect
+import contextlib
+import functools
+import os
+import threading
+import time
+
+# 초 단위 버킷 (수십 µs 템플릿 뽑기부터 수 초짜리 기상청 호출까지)
+BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+_BUCKET_LABELS = tuple(f"{bound:.6f}".rstrip("0").rstrip(".") for bound in BUCKETS)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_enabled = os.getenv("FORTUNE_METRICS", "1") != "0"
+_histograms = {}
+_counters = {}
+_lock = threading.Lock()
+_NOOP = contextlib.nullcontext()
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (합계/개수 포함)"""
+
+    __slots__ = ("counts", "total", "count", "_lock")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        index = bisect.bisect_left(BUCKETS, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += seconds
+            self.count += 1
+
+
+class _Timer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+def enabled():
+    return _enabled
+
+
+def set_enabled(value):
+    global _enabled
+    _enabled = bool(value)
+
+
+def histogram(stage):
+    hist = _histograms.get(stage)
+    if hist is None:
+        with _lock:
+            hist = _histograms.setdefault(stage, Histogram())
+    return hist
+
+
+def timer(stage):
+    """with 블록 소요 시간을 stage 히스토그램에 기록 (꺼져 있으면 공용 no-op)"""
+    if not _enabled:
+        return _NOOP
+    return _Timer(histogram(stage))
+
+
+def observe(stage, seconds):
+    if _enabled:
+        histogram(stage).observe(seconds)
+
+
+def timed(stage):
+    """함수 호출 시간을 stage 히스토그램에 기록하는 데코레이터"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram(stage).observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def inc(event, value=1):
+    """event 카운터 증가"""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[event] = _counters.get(event, 0) + value
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus():
+    """모은 값 → Prometheus 텍스트 형식"""
+    with _lock:
+        histograms = sorted(_histograms.items())
+        counters = sorted(_counters.items())
+    lines = [
+        "# HELP nunchi_stage_seconds Time spent per stage.",
+        "# TYPE nunchi_stage_seconds histogram",
+    ]
+    for stage, hist in histograms:
+        with hist._lock:
+            counts, total, count = list(hist.counts), hist.total, hist.count
+        stage = _label(stage)
+        cumulative = 0
+        for bound, bucket_count in zip(_BUCKET_LABELS, counts):
+            cumulative += bucket_count
+            lines.append(f'nunchi_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+        lines.append(f'nunchi_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {count}')
+        lines.append(f'nunchi_stage_seconds_sum{{stage="{stage}"}} {total}')
+        lines.append(f'nunchi_stage_seconds_count{{stage="{stage}"}} {count}')
+    lines += [
+        "# HELP nunchi_events_total Event counters.",
+        "# TYPE nunchi_events_total counter",
+    ]
+    for event, value in counters:
+        lines.append(f'nunchi_events_total{{event="{_label(event)}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(port, host="127.0.0.1"):
+    """/metrics만 내주는 서버를 데몬 스레드로 띄운다 (Streamlit처럼 라우트를 못 붙이는 곳용)"""
+    # http.server는 포트를 켰을 때만 필요하므로 여기서 가져온다 (앱 기동 시간)
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
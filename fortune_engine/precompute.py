@@ -0,0 +1,222 @@
+# --- 운세 사전 계산 테이블 ---
+# 결정적인 부분(날짜 × 시간대 × MBTI × 별자리 × 띠 × 날씨)을 밤마다 미리 뽑아
+# 파일 하나에 저장해두고, 클릭 시에는 인덱스 한 번으로 꺼내 쓴다.
+#
+#   python -m fortune_engine.precompute --days 7 --out fortune_table.bin
+#
+# 파일 형식: MAGIC(8) + 헤더 길이(uint32, little endian) + 헤더 JSON + 행 데이터
+# 행 데이터는 조합마다 len(PICK_FIELDS) 바이트 (각 항목의 템플릿 인덱스, 후보는 255개 이하)
+import datetime
+import functools
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+
+from .constants import ANIMALS, MBTI_LIST, TIME_SLOTS, WEATHER_CONDITIONS, ZODIAC_SIGNS
+from . import clock
+from .birth import get_birth_profile
+from .context import get_day_context
+from .dates import get_time_slot
+from .engine import PICK_FIELDS, SEED_KEY, fortune_pools, fortune_seed, pick_fortune, render_fortune
+from .templates import TEMPLATES
+
+MAGIC = b"NRFTBL01"
+ROW_WIDTH = len(PICK_FIELDS)
+ROWS_PER_SLOT = len(MBTI_LIST) * len(ZODIAC_SIGNS) * len(ANIMALS) * len(WEATHER_CONDITIONS)
+ROWS_PER_DAY = len(TIME_SLOTS) * ROWS_PER_SLOT
+
+_MBTI_CODES = {v: i for i, v in enumerate(MBTI_LIST)}
+_ZODIAC_CODES = {v: i for i, v in enumerate(ZODIAC_SIGNS)}
+_ANIMAL_CODES = {v: i for i, v in enumerate(ANIMALS)}
+_SLOT_CODES = {v: i for i, v in enumerate(TIME_SLOTS)}
+_WEATHER_CODES = {v: i for i, v in enumerate(WEATHER_CONDITIONS)}
+
+
+@functools.cache
+def template_fingerprint():
+    """템플릿/시드 키/코드 순서가 바뀌면 달라지는 지문 (낡은 테이블 감지용, 모두 불변이라 프로세스당 한 번)"""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (SEED_KEY, TEMPLATES, PICK_FIELDS, MBTI_LIST, ZODIAC_SIGNS, ANIMALS, TIME_SLOTS, WEATHER_CONDITIONS):
+        h.update(repr(part).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _row_index(day_offset, time_slot, mbti, zodiac, animal, weather_condition):
+    # 목록에 없는 날씨는 generate_fortune과 같이 '흐림'으로 취급
+    weather = _WEATHER_CODES.get(weather_condition, _WEATHER_CODES["흐림"])
+    index = day_offset
+    index = index * len(TIME_SLOTS) + _SLOT_CODES[time_slot]
+    index = index * len(MBTI_LIST) + _MBTI_CODES[mbti]
+    index = index * len(ZODIAC_SIGNS) + _ZODIAC_CODES[zodiac]
+    index = index * len(ANIMALS) + _ANIMAL_CODES[animal]
+    return index * len(WEATHER_CONDITIONS) + weather
+
+
+def day_info(day):
+    """날짜만으로 정해지는 부분 (테이블 헤더에 저장)"""
+    context = get_day_context(day)
+    return {
+        "date": day.isoformat(),
+        "day_type": context.day_type,
+        "holiday_name": context.holiday_name,
+        "season": context.season,
+        "specials": list(context.specials),
+        "lunar": list(context.lunar),
+    }
+
+
+def slot_rows(day, info, time_slot):
+    """한 날짜·시간대의 MBTI × 별자리 × 띠 × 날씨 전체 조합 행 (ROWS_PER_SLOT × ROW_WIDTH 바이트)"""
+    rows = bytearray()
+    for mbti in MBTI_LIST:
+        for zodiac in ZODIAC_SIGNS:
+            for animal in ANIMALS:
+                seed = fortune_seed(day, mbti, zodiac, animal, time_slot)
+                for weather_condition in WEATHER_CONDITIONS:
+                    pools = fortune_pools(mbti, zodiac, animal, weather_condition,
+                                          info["day_type"], info["season"], time_slot)
+                    rows += bytes(pick_fortune(pools, seed))
+    return rows
+
+
+def build_fortune_table(path, start, days):
+    """start부터 days일치 테이블을 만들어 path에 저장 (임시 파일에 쓴 뒤 교체)"""
+    day_list = [start + datetime.timedelta(days=i) for i in range(days)]
+    header = {
+        "fingerprint": template_fingerprint(),
+        "start": start.isoformat(),
+        "row_width": ROW_WIDTH,
+        "days": [day_info(day) for day in day_list],
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for day, info in zip(day_list, header["days"]):
+            for time_slot in TIME_SLOTS:
+                f.write(slot_rows(day, info, time_slot))
+    os.replace(tmp_path, path)
+    return path
+
+
+class FortuneTable:
+    """사전 계산 테이블 (mmap으로 열어서 조합별 행을 바로 읽는다)"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"운세 테이블 형식이 아님: {path}")
+        (header_len,) = struct.unpack_from("<I", self._mm, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(self._mm[header_start:header_start + header_len].decode("utf-8"))
+        if header["fingerprint"] != template_fingerprint() or header["row_width"] != ROW_WIDTH:
+            raise ValueError(f"템플릿이 바뀌어 다시 계산해야 하는 테이블: {path}")
+        self._rows_start = header_start + header_len
+        self.start = datetime.date.fromisoformat(header["start"])
+        self.days = header["days"]
+
+    def __contains__(self, day):
+        return 0 <= (day - self.start).days < len(self.days)
+
+    def close(self):
+        self._mm.close()
+
+    def lookup(self, mbti, zodiac, animal, birth_date, weather_condition, today, time_slot=None, random_rng=None, profile=None):
+        """generate_fortune과 같은 결과를 테이블 조회로 반환 (범위 밖 날짜는 KeyError)"""
+        if today not in self:
+            raise KeyError(today)
+        if time_slot is None:
+            time_slot = get_time_slot()
+        day_offset = (today - self.start).days
+        info = self.days[day_offset]
+
+        offset = self._rows_start + _row_index(day_offset, time_slot, mbti, zodiac, animal, weather_condition) * ROW_WIDTH
+        picks = self._mm[offset:offset + ROW_WIDTH]
+
+        # 사용자별로 남는 건 생일 체크뿐 (오늘 음력은 헤더에 저장됨)
+        special_days = []
+        if birth_date.month == today.month and birth_date.day == today.day:
+            special_days.append("양력생일")
+        if list((profile or get_birth_profile(birth_date)).lunar_md) == info["lunar"]:
+            special_days.append("음력생일")
+        special_days += info["specials"]
+
+        pools = fortune_pools(mbti, zodiac, animal, weather_condition, info["day_type"], info["season"], time_slot)
+        return render_fortune(pools, picks, zodiac, animal, time_slot,
+                              info["day_type"], info["holiday_name"], special_days, random_rng)
+
+    def slot_rows(self, today, time_slot):
+        """한 날짜·시간대의 행 전체 (slot_rows()와 같은 배치, 복사 없는 memoryview)"""
+        if today not in self:
+            raise KeyError(today)
+        index = (today - self.start).days * len(TIME_SLOTS) + _SLOT_CODES[time_slot]
+        offset = self._rows_start + index * ROWS_PER_SLOT * ROW_WIDTH
+        return memoryview(self._mm)[offset:offset + ROWS_PER_SLOT * ROW_WIDTH]
+
+
+class FortuneTableFile:
+    """경로의 사전 계산 테이블을 열어 두고, 파일이 새로 만들어지면(os.replace) 다시 연다
+
+    밤마다 테이블을 다시 만들어도 프로세스를 재시작하지 않아도 되게 get()에서 파일을 확인한다.
+    stat은 CHECK_INTERVAL초에 한 번, 열어 둔 테이블이 없거나 오늘이 없으면 매번.
+    """
+
+    CHECK_INTERVAL = 30.0
+
+    def __init__(self, path):
+        self.path = path
+        self._table = None
+        self._file_id = None  # 마지막으로 열어 본 파일 (inode, mtime, 크기)
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, today):
+        """today가 들어 있는 테이블 (없으면 None → 즉석 생성)"""
+        table = self._table
+        if table is None or today not in table or time.monotonic() - self._checked_at >= self.CHECK_INTERVAL:
+            table = self._reload()
+        return table if table is not None and today in table else None
+
+    def _reload(self):
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                return self._table  # 파일이 잠깐 없어도 열어 둔 mmap은 그대로 읽을 수 있다
+            file_id = (st.st_ino, st.st_mtime_ns, st.st_size)
+            if file_id != self._file_id:
+                # 같은 파일은 깨졌거나 낡았어도 다시 열어 보지 않는다 (바뀔 때까지 즉석 생성)
+                self._file_id = file_id
+                try:
+                    # 이전 테이블은 다른 스레드가 아직 읽고 있을 수 있어 닫지 않는다 (참조가 없어지면 정리됨)
+                    self._table = FortuneTable(self.path)
+                except (OSError, ValueError):
+                    self._table = None
+            return self._table
+
+
+def main(argv=None):
+    import argparse  # CLI에서만 (패키지 import 시간)
+
+    parser = argparse.ArgumentParser(description="운세 사전 계산 테이블 생성")
+    parser.add_argument("--out", default="fortune_table.bin", help="출력 파일 경로")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, default=None, help="시작 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("--days", type=int, default=7, help="계산할 일수")
+    args = parser.parse_args(argv)
+
+    start = args.start or clock.today()
+    build_fortune_table(args.out, start, args.days)
+    print(f"{args.out}: {start} ~ {start + datetime.timedelta(days=args.days - 1)} ({args.days * ROWS_PER_DAY:,} 조합)")
+
+
+if __name__ == "__main__":
+    main()
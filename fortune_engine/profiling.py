@@ -0,0 +1,303 @@
+# --- 실서비스 샘플링 프로파일러 ---
+# 스크립트 실행/운세 생성 중 일부만 골라 프로파일러를 붙이고, 결과를 파일 하나씩 남긴다.
+# 고정 타이머(metrics)로는 안 보이는 곳(예: holidays.KR()가 연도를 처음 채울 때)을 실제 트래픽 분포에서 찾는 용도.
+#
+#   FORTUNE_PROFILE_RATE=0.01                               # 모든 종류 1%
+#   FORTUNE_PROFILE_RATE="app_run=0.05,generate_fortune=0.001"  # 종류별
+#   FORTUNE_PROFILE_MODE=pstats   # cProfile → .pstats (기본, python -m pstats / snakeviz로 보기)
+#   FORTUNE_PROFILE_MODE=stack    # 스택 샘플링 → .folded (flamegraph.pl / speedscope에 그대로)
+#   FORTUNE_PROFILE_DIR=profiles
+#
+# 파일 이름: {종류}_{MBTI}_{지역}_{시간대}_{시각}_{pid}.pstats|.folded (모르는 태그는 '-')
+# 비율이 0이면(기본) 호출당 비용은 dict 조회 한 번이다.
+import contextlib
+import contextvars
+import functools
+import os
+import random
+import re
+import sys
+import threading
+from collections import Counter
+
+from . import clock
+
+MODES = ("pstats", "stack")
+TAG_KEYS = ("mbti", "district", "time_slot")
+
+_rates = {}
+_default_rate = 0.0
+_mode = "pstats"
+_directory = "profiles"
+_interval = 0.001  # stack 모드 샘플 간격 (초)
+
+_rng = random.Random()
+_local = threading.local()
+# cProfile은 프로세스에 하나만 (3.12부터 sys.monitoring 도구가 프로세스 전역이라 동시에 켜면 실패)
+_cprofile_lock = threading.Lock()
+_cprofile_owner = None  # 지금 cProfile을 잡고 있는 Sample
+_halt_lock = threading.Lock()
+_tags = contextvars.ContextVar("profile_tags", default={})
+
+
+def parse_rates(value):
+    """"0.01" 또는 "app_run=0.05,generate_fortune=0.001" → (기본 비율, {종류: 비율})"""
+    default, rates = 0.0, {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        kind, sep, rate = part.rpartition("=")
+        rate = float(rate)
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"프로파일 비율은 0~1: {part}")
+        if sep:
+            rates[kind.strip()] = rate
+        else:
+            default = rate
+    return default, rates
+
+
+def configure(rate=None, mode=None, directory=None, interval=None):
+    """샘플링 설정 변경 (rate는 숫자, 종류별 dict, 또는 환경 변수와 같은 문자열)"""
+    global _default_rate, _rates, _mode, _directory, _interval
+    if rate is not None:
+        if isinstance(rate, str):
+            _default_rate, _rates = parse_rates(rate)
+        elif isinstance(rate, dict):
+            _default_rate, _rates = 0.0, dict(rate)
+        else:
+            _default_rate, _rates = float(rate), {}
+    if mode is not None:
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 프로파일 방식: {mode}")
+        _mode = mode
+    if directory is not None:
+        _directory = directory
+    if interval is not None:
+        _interval = float(interval)
+
+
+def rate_for(kind):
+    return _rates.get(kind, _default_rate)
+
+
+@contextlib.contextmanager
+def tags(**values):
+    """with 블록 안에서 시작하는 샘플에 태그를 붙인다 (예: 운세 생성 쪽에서는 모르는 지역)"""
+    token = _tags.set({**_tags.get(), **values})
+    try:
+        yield
+    finally:
+        _tags.reset(token)
+
+
+def _safe(value):
+    text = "-" if value is None else str(value)
+    return re.sub(r"[^\w.-]+", "-", text).strip("-") or "-"
+
+
+class _StackSampler:
+    """대상 스레드의 스택을 일정 간격으로 떠서 접힌 스택(collapsed stack)별로 센다"""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class Sample:
+    """프로파일 샘플 하나 (begin으로 시작, stop에서 파일로 쓴다)"""
+
+    def __init__(self, kind, mode, directory, interval, tags):
+        self.kind = kind
+        self.mode = mode
+        self.directory = directory
+        self.interval = interval
+        self.tags = tags
+        self.path = None
+        self.thread = threading.current_thread()
+        self._profiler = None
+        self._sampler = None
+        self._running = False
+
+    def tag(self, **values):
+        self.tags.update(values)
+
+    def _start(self):
+        """프로파일러 시작 (다른 스레드가 cProfile을 쓰고 있으면 False)"""
+        global _cprofile_owner
+        if self.mode == "stack":
+            self._sampler = _StackSampler(threading.get_ident(), self.interval)
+            self._sampler.start()
+            self._running = True
+            return True
+        if not _cprofile_lock.acquire(blocking=False):
+            if not _reclaim_cprofile() or not _cprofile_lock.acquire(blocking=False):
+                return False
+        import cProfile
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        self._running = True
+        _cprofile_owner = self
+        return True
+
+    def _halt(self):
+        global _cprofile_owner
+        with _halt_lock:
+            running, self._running = self._running, False
+            if running and self._profiler is not None and _cprofile_owner is self:
+                _cprofile_owner = None
+        if running:
+            if self._sampler is not None:
+                self._sampler.stop()
+            if self._profiler is not None:
+                self._profiler.disable()
+                _cprofile_lock.release()
+        if getattr(_local, "active", None) is self:
+            _local.active = None
+
+    def discard(self):
+        """파일을 쓰지 않고 끝낸다"""
+        self._halt()
+
+    def stop(self):
+        """프로파일러를 멈추고 파일을 쓴 뒤 경로 반환 (쓰기 실패는 응답에 영향을 주지 않게 None)"""
+        if not self._running:
+            return self.path
+        self._halt()
+        stamp = clock.now().strftime("%Y%m%dT%H%M%S")
+        name = "_".join([_safe(self.kind), *(_safe(self.tags.get(key)) for key in TAG_KEYS), stamp, str(os.getpid())])
+        suffix = ".folded" if self.mode == "stack" else ".pstats"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, name + suffix)
+            counter = 1
+            while os.path.exists(path):
+                path = os.path.join(self.directory, f"{name}-{counter}{suffix}")
+                counter += 1
+            if self._sampler is not None:
+                self._sampler.write(path)
+            else:
+                self._profiler.dump_stats(path)
+        except OSError:
+            return None
+        self.path = path
+        return path
+
+
+class _NoSample:
+    """샘플로 뽑히지 않았을 때 (모든 동작이 no-op)"""
+
+    path = None
+
+    def tag(self, **values):
+        pass
+
+    def discard(self):
+        pass
+
+    def stop(self):
+        return None
+
+
+_NO_SAMPLE = _NoSample()
+
+
+def _reclaim_cprofile():
+    """cProfile을 잡은 채 스레드가 끝난 샘플(stop 없이 죽은 스크립트 실행 등)을 정리 → 정리했으면 True
+
+    threading.local이라 죽은 스레드의 샘플은 다른 스레드에서 보이지 않으므로 여기서 락을 돌려받는다.
+    """
+    owner = _cprofile_owner
+    if owner is None or owner.thread.is_alive():
+        return False
+    owner.discard()
+    return True
+
+
+def begin(kind, force=False, **values):
+    """rate_for(kind) 확률로 프로파일 시작 → Sample (뽑히지 않으면 no-op 객체)
+
+    같은 스레드에서 이미 샘플이 돌고 있으면 그 샘플이 이 구간까지 담으므로 새로 시작하지 않는다.
+    단 같은 종류가 돌고 있으면 이전 실행이 중간에 끊긴 것(Streamlit 리런 등)이라 버리고 새로 시작한다.
+    """
+    active = getattr(_local, "active", None)
+    if active is not None:
+        if active.kind != kind:
+            return _NO_SAMPLE
+        active.discard()
+    rate = _rates.get(kind, _default_rate)
+    if not force and (rate <= 0.0 or _rng.random() >= rate):
+        return _NO_SAMPLE
+    sample = Sample(kind, _mode, _directory, _interval, {**_tags.get(), **values})
+    if not sample._start():
+        return _NO_SAMPLE
+    _local.active = sample
+    return sample
+
+
+@contextlib.contextmanager
+def sample(kind, **values):
+    """with 블록 하나를 확률적으로 프로파일 (as로 받은 객체에 .tag()로 태그 추가, 예외로 끝나면 버린다)"""
+    current = begin(kind, **values)
+    try:
+        yield current
+    except BaseException:
+        current.discard()
+        raise
+    current.stop()
+
+
+def sampled(kind, tag_args=("mbti", "time_slot")):
+    """함수 호출을 확률적으로 프로파일하는 데코레이터 (tag_args 인자 값을 태그로)"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            rate = _rates.get(kind, _default_rate)
+            if rate <= 0.0 or _rng.random() >= rate:
+                return fn(*args, **kwargs)
+            # inspect는 뽑혔을 때만 가져온다 (비율 0이면 import도 하지 않게)
+            import inspect
+            bound = inspect.signature(fn).bind(*args, **kwargs).arguments
+            values = {key: bound[key] for key in tag_args if bound.get(key) is not None}
+            current = begin(kind, force=True, **values)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                current.stop()
+        return wrapper
+    return decorator
+
+
+configure(
+    rate=os.getenv("FORTUNE_PROFILE_RATE", "0"),
+    mode=os.getenv("FORTUNE_PROFILE_MODE", "pstats"),
+    directory=os.getenv("FORTUNE_PROFILE_DIR", "profiles"),
+    interval=os.getenv("FORTUNE_PROFILE_INTERVAL", "0.001"),
+)
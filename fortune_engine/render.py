@@ -0,0 +1,161 @@
+# --- 결과 리포트 렌더링 ---
+# 운세 dict → 화면에 그릴 HTML/Markdown 본문과 공유 텍스트를 한 번에 만든다.
+# '오늘의 변수'만 요청마다 바뀌므로 그 자리를 비워둔 채로 캐시하고, 꺼낼 때 끼워 넣는다.
+import threading
+from collections import OrderedDict
+
+from . import metrics
+
+WEEKDAYS_KR = ("월", "화", "수", "목", "금", "토", "일")
+COMPAT_COLORS = {"좋음": "🟢", "보통": "🟡", "주의": "🔴"}
+SHARE_URL = "https://nunchi-radar.streamlit.app"
+
+# 캐시된 본문에서 오늘의 변수가 들어갈 자리
+_RANDOM_VAR = "\x00random_var\x00"
+
+
+def _short(text, limit, keep):
+    return text[:keep] + "..." if len(text) > limit else text
+
+
+def _card(icon, title, value):
+    return f'<div class="info-card"><div class="big-icon">{icon}</div><div class="card-title">{title}</div><div class="card-value">{value}</div></div>'
+
+
+def render_report(fortune, zodiac, today):
+    """운세 dict → (본문 HTML/Markdown, 공유 텍스트), 오늘의 변수 자리는 비워둔 채로"""
+    compat_level, compat_comment = fortune["compatibility"]
+    compat_color = COMPAT_COLORS[compat_level]
+
+    parts = []
+    # 특수일 배너
+    for msg in fortune["special_messages"]:
+        parts.append(f'<div class="special-banner"><div class="special-banner-title">{msg}</div></div>')
+    parts.append(f'<div class="intro-box">✅ {fortune["time_intro"]}</div>')
+
+    # 메인 카드 (4열, 좁은 화면에서는 2열)
+    parts.append('<div class="card-row">' + "".join((
+        _card("🔮", "오늘 한줄", _short(fortune["main"], 20, 20)),
+        _card("🌅", "오전", _short(fortune["morning_day"], 20, 18)),
+        _card("🌆", "오후", _short(fortune["afternoon_day"], 20, 18)),
+        _card("🍀", "행운템", fortune["lucky_item"]),
+    )) + "</div>")
+
+    # 오늘의 변수 박스
+    parts.append(f'<div class="variable-box"><div class="variable-title">🎲 오늘의 변수</div><div class="variable-content">"{_RANDOM_VAR}"</div></div>')
+
+    # 상세 분석
+    parts.append(f"""---
+
+### 📋 상세 전략 리포트
+
+**🌤️ 오늘의 컨디션**: {fortune['season_vibe']}
+
+**{compat_color} 띠x별자리 궁합**: {compat_level} - {compat_comment}
+
+---
+
+#### ⏰ 타임라인 전략
+
+**🌅 오전 (출근~점심)**
+> {fortune['morning_day']}
+
+⭐ {zodiac} 오전 기운: {fortune['morning_zodiac']}
+
+**🍱 점심시간**
+> {fortune['lunch']}
+
+**🌆 오후 (점심 후~퇴근)**
+> {fortune['afternoon_day']}
+
+⭐ {zodiac} 오후 기운: {fortune['afternoon_zodiac']}
+
+**🌙 퇴근 후**
+> {fortune['evening']}
+
+---
+
+#### 💡 오늘의 직장인 꿀팁
+
+> {fortune['office_tip']}
+
+---
+
+#### 🍽️ 오늘의 점심 추천
+
+> {fortune['lunch_menu']}
+
+---
+
+#### ⚠️ 오늘의 주의보
+
+> {fortune['warning']}
+
+---
+
+#### 🍀 행운템: {fortune['lucky_item']}
+
+{fortune['lucky_reason']} 아이템이야.  
+책상 위에 두거나, 오늘 하루 가까이 두면 좋은 기운이 올 거야!""")
+
+    # HTML 블록과 Markdown이 섞이므로 빈 줄로 구분
+    body = "\n\n".join(parts)
+
+    share_text = f"""[오늘의 눈치 레이더] {today.strftime('%m/%d')} ({WEEKDAYS_KR[today.weekday()]}) {fortune['day_type']}
+
+🔮 한줄: {fortune['main'][:40]}
+🌅 오전: {fortune['morning_day'][:40]}
+🌆 오후: {fortune['afternoon_day'][:40]}
+💡 꿀팁: {fortune['office_tip'][:40]}
+🎲 변수: {_RANDOM_VAR}
+🍀 행운템: {fortune['lucky_item']}
+
+👉 나도 해보기: {SHARE_URL}"""
+    return body, share_text
+
+
+def fill_random_var(rendered, random_var):
+    """render_report 결과에 오늘의 변수를 끼워 넣은 (본문, 공유 텍스트)"""
+    body, share_text = rendered
+    return body.replace(_RANDOM_VAR, random_var), share_text.replace(_RANDOM_VAR, random_var)
+
+
+def report_key(fortune, mbti, zodiac, animal, weather_condition, today):
+    """리포트 캐시 키 (오늘의 변수를 뺀 결정적 입력, 특수일에 생일 여부가 들어 있다)"""
+    return (today, fortune["time_slot"], mbti, zodiac, animal, weather_condition, tuple(fortune["special_days"]))
+
+
+class ReportCache:
+    """렌더링된 리포트 LRU (키에 날짜·시간대가 들어 있어 지난 항목은 밀려난다)"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def render(self, key, fortune, zodiac, today):
+        """(본문, 공유 텍스트) - 같은 키면 다시 만들지 않고 오늘의 변수만 끼워 넣는다"""
+        with self._lock:
+            rendered = self._entries.get(key)
+            if rendered is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        metrics.inc("report_cache_miss" if rendered is None else "report_cache_hit")
+        if rendered is None:
+            with metrics.timer("render_report"):
+                rendered = render_report(fortune, zodiac, today)
+            with self._lock:
+                self._entries[key] = rendered
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return fill_random_var(rendered, fortune["random_var"])
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
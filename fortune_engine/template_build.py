@@ -0,0 +1,46 @@
+# --- 템플릿 아티팩트 관리 ---
+# template_source.py(원문) → data/templates.bin (시작 시 templates.py가 읽는 미리 컴파일된 템플릿)
+#
+#   python -m fortune_engine.template_build build    # 원문을 고친 뒤 다시 생성
+#   python -m fortune_engine.template_build verify   # 아티팩트가 원문과 같은지 확인 (CI용)
+import argparse
+import os
+import sys
+
+from .templates import TEMPLATE_ARTIFACT_PATH, TEMPLATE_SOURCE_PATH, _freeze, dump_artifact, load_artifact, load_source, source_digest
+
+
+def build_template_artifact(path=TEMPLATE_ARTIFACT_PATH, source_path=TEMPLATE_SOURCE_PATH):
+    """템플릿 원문을 읽어 아티팩트 파일 생성"""
+    data = dump_artifact(_freeze(load_source()), source_digest(source_path))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def verify_template_artifact(path=TEMPLATE_ARTIFACT_PATH, source_path=TEMPLATE_SOURCE_PATH):
+    """아티팩트가 원문 지문과 맞고 내용도 같으면 True"""
+    loaded = load_artifact(path, source_path)
+    return loaded is not None and _freeze(loaded) == _freeze(load_source())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="템플릿 아티팩트 관리")
+    parser.add_argument("command", choices=["build", "verify"])
+    parser.add_argument("--path", default=TEMPLATE_ARTIFACT_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        size = build_template_artifact(args.path)
+        print(f"{args.path}: {size:,} bytes")
+        return 0
+    if not verify_template_artifact(args.path):
+        print(f"{args.path}: 원문(template_source.py)과 다름 → build로 다시 생성")
+        return 1
+    print(f"{args.path}: 원문과 일치")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""운세 템플릿 데이터
+
+프로세스당 한 번만 로드해서 불변 구조(tuple / MappingProxyType)로 고정한다.
+Streamlit 리런마다 dict 리터럴을 다시 만들지 않도록 app.py에서 분리했다.
+
+원문은 template_source.py이고, 시작할 때는 미리 컴파일해 둔 data/templates.bin(marshal)을 읽는다.
+파일이 없거나 원문과 지문이 다르면(원문만 고치고 다시 안 만든 경우) 원문을 import해서 쓴다.
+
+파일 형식: MAGIC(8) + 원문 BLAKE2b-256(32) + marshal(dict, list는 tuple로)
+"""
+import hashlib
+import marshal
+import os
+from types import MappingProxyType
+
+MAGIC = b"NRTMPL01"
+MARSHAL_VERSION = 4
+TEMPLATE_SOURCE_PATH = os.path.join(os.path.dirname(__file__), "template_source.py")
+TEMPLATE_ARTIFACT_PATH = os.path.join(os.path.dirname(__file__), "data", "templates.bin")
+_DIGEST_SIZE = 32
+
+
+def source_digest(path=TEMPLATE_SOURCE_PATH):
+    """템플릿 원문 파일 지문 (아티팩트가 낡았는지 비교용)"""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=_DIGEST_SIZE).digest()
+
+
+def load_artifact(path=TEMPLATE_ARTIFACT_PATH, source_path=TEMPLATE_SOURCE_PATH):
+    """미리 컴파일한 템플릿 → dict (없거나 원문과 다르면 None)"""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = source_digest(source_path)
+    except OSError:
+        return None
+    header_size = len(MAGIC) + _DIGEST_SIZE
+    if data[:len(MAGIC)] != MAGIC or data[len(MAGIC):header_size] != digest:
+        return None
+    try:
+        return marshal.loads(data[header_size:])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def load_source():
+    """템플릿 원문을 import해서 dict로 (아티팩트를 쓸 수 없을 때)"""
+    from .template_source import RAW_TEMPLATES
+    return RAW_TEMPLATES
+
+
+def _freeze(value):
+    """list → tuple, dict → 읽기 전용 매핑으로 재귀 변환 (아티팩트에서 온 tuple은 이미 불변이라 그대로)"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """TEMPLATES → marshal로 쓸 수 있는 dict/tuple"""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+def dump_artifact(templates, digest):
+    """TEMPLATES와 원문 지문 → 아티팩트 bytes"""
+    return MAGIC + digest + marshal.dumps(_thaw(templates), MARSHAL_VERSION)
+
+
+TEMPLATES = _freeze(load_artifact() or load_source())
@@ -0,0 +1,303 @@
+# --- 기상청 초단기실황 날씨 ---
+# 업무지구 격자점을 백그라운드에서 주기적으로 받아 프로세스 공용 캐시에 넣어두고,
+# 세션은 캐시만 읽는다 (사용자 요청 중에 기상청 API를 기다리지 않음).
+import datetime
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import clock, metrics
+
+_log = logging.getLogger(__name__)
+
+KMA_URL = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getUltraSrtNcst"
+
+# 한 번도 받지 못했을 때 보여주는 값
+FALLBACK_WEATHER = ("📡", "수신불가", "흐림")
+
+# 초단기실황은 매시 정각 관측분이 40분 무렵 올라오므로 45분에 갱신
+PUBLISH_DELAY = datetime.timedelta(minutes=40)
+REFRESH_MINUTE = 45
+
+# 실패한 격자점이 있으면 다음 정시를 기다리지 않고 이 간격으로 재시도
+RETRY_SECONDS = 60
+
+# 공유 캐시에 넣은 관측값 보관 시간 (다음 슬롯이 올라올 때까지 + 여유)
+SHARED_TTL_SECONDS = 2 * 3600
+
+# 공유 캐시 값 형식 버전 (값 모양을 바꾸면 올려서 이전 레플리카가 쓴 값을 읽지 않게)
+SHARED_SCHEMA = 1
+
+
+def resolve_base_time(now=None):
+    """now 시점에 조회 가능한 최신 관측 슬롯 (base_date, base_time)
+
+    발표 전(정시~40분)이면 한 시간 전 슬롯이고, 자정 직후에는 전날 23시(연말이면 전년도)로 넘어간다.
+    """
+    now = now or clock.now()
+    slot = (now - PUBLISH_DELAY).replace(minute=0, second=0, microsecond=0)
+    return slot.strftime("%Y%m%d"), slot.strftime("%H00")
+
+
+def parse_observation(res):
+    """초단기실황 응답 JSON → (아이콘, 기온 텍스트, 날씨 상태)"""
+    items = res['response']['body']['items']['item']
+    data = {i['category']: i['obsrValue'] for i in items}
+    pty, temp = int(data.get('PTY', 0)), data.get('T1H', '?')
+    if pty == 0:
+        icon, condition = "☀️", "맑음"
+    elif pty in [1, 5]:
+        icon, condition = "☔", "비"
+    elif pty in [2, 6]:
+        icon, condition = "🌨️", "눈"
+    else:
+        icon, condition = "☁️", "흐림"
+    return icon, f"{temp}℃", condition
+
+
+class CircuitOpenError(Exception):
+    """연속 실패로 회로가 열려 요청을 보내지 않음"""
+
+
+class CircuitBreaker:
+    """연속 failure_threshold번 실패하면 reset_timeout초 동안 요청 차단
+
+    차단 시간이 지나면 한 번만 시험 요청을 허용하고(half-open), 성공하면 다시 닫힌다.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if not self._trial and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+
+class WeatherClient:
+    """기상청 초단기실황 클라이언트
+
+    keep-alive 세션 풀을 공유하고, 여러 격자점을 제한된 스레드풀로 동시에 받는다.
+    네트워크/5xx 오류는 지터를 섞은 지수 백오프로 재시도하고, 계속 실패하면 회로를 연다.
+    4xx는 재시도하지 않고, 읽을 수 없는 응답(기상청 오류 본문 등)은 실패로 세되 재시도하지 않는다.
+    base_url을 바꾸면 로컬 가짜 기상청 서버를 상대로 돌려볼 수 있다.
+    """
+
+    def __init__(self, api_key, base_url=KMA_URL, timeout=3.0, retries=2, backoff=0.3, max_workers=8, breaker=None):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_workers = max_workers
+        self.breaker = breaker or CircuitBreaker()
+        self._jitter = random.Random()
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """keep-alive 세션 (requests는 import만 수십 ms라 첫 요청 때 만든다, 보통 갱신 스레드 안)"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+    def fetch(self, nx, ny, slot=None):
+        """격자점 하나의 관측 슬롯(기본: 최신) 날씨를 받아온다 (실패 시 예외)"""
+        import requests
+
+        base_date, base_time = slot or resolve_base_time()
+        params = {"serviceKey": self.api_key, "dataType": "JSON", "base_date": base_date, "base_time": base_time, "nx": nx, "ny": ny}
+
+        for attempt in range(self.retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError(self.base_url)
+            try:
+                with metrics.timer("kma_fetch"):
+                    res = self.session.get(self.base_url, params=params, timeout=self.timeout)
+                if res.status_code >= 500:
+                    res.raise_for_status()
+            except requests.RequestException:
+                metrics.inc("kma_fetch_error")
+                self.breaker.record_failure()
+                if attempt == self.retries:
+                    raise
+                time.sleep(self._jitter.uniform(0, self.backoff * 2 ** attempt))
+                continue
+            if res.status_code >= 400:
+                # 4xx(잘못된 서비스 키 등)는 다시 보내도 같으므로 재시도하지 않고, 서버는 응답했으니 회로도 열지 않는다
+                metrics.inc("kma_client_error")
+                self.breaker.record_success()
+                res.raise_for_status()
+            try:
+                weather = parse_observation(res.json())
+            except (ValueError, KeyError, TypeError) as e:
+                # 200이지만 기상청 오류 본문(resultCode != 00)이면 items가 없다
+                metrics.inc("kma_parse_error")
+                self.breaker.record_failure()
+                raise ValueError(f"기상청 응답을 읽을 수 없음: {res.text[:200]}") from e
+            self.breaker.record_success()
+            return weather
+
+    def fetch_many(self, points, slot=None):
+        """여러 격자점을 같은 관측 슬롯으로 동시에 받아 {(nx, ny): 날씨} 반환 (실패한 격자점은 빠짐)"""
+        slot = slot or resolve_base_time()
+        points = list(points)
+        if not points:
+            return {}
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(points))) as pool:
+            futures = {pool.submit(self.fetch, nx, ny, slot): (nx, ny) for nx, ny in points}
+            for future, point in futures.items():
+                try:
+                    results[point] = future.result()
+                except Exception:
+                    pass
+        return results
+
+
+def _decode_shared(data):
+    """공유 캐시 값 → (아이콘, 기온 텍스트, 날씨 상태), 모양이 다르면 None (기상청에서 다시 받음)"""
+    try:
+        weather = json.loads(data)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(weather, list) or len(weather) != 3 or not all(isinstance(v, str) for v in weather):
+        return None
+    return tuple(weather)
+
+
+def seconds_until_refresh(now=None):
+    """다음 갱신 시각(매시 REFRESH_MINUTE분)까지 남은 초"""
+    now = now or clock.now()
+    target = now.replace(minute=REFRESH_MINUTE, second=0, microsecond=0)
+    if target <= now:
+        target += datetime.timedelta(hours=1)
+    return (target - now).total_seconds()
+
+
+class WeatherRefresher:
+    """업무지구 날씨를 백그라운드 스레드로 미리 받아두는 공용 캐시
+
+    캐시는 시각 TTL이 아니라 관측 슬롯(base_date, base_time) 기준이라
+    이미 받은 슬롯은 다시 요청하지 않는다.
+    fetch가 실패하면 마지막으로 받은 값을 그대로 둔다 (stale-while-revalidate).
+    한 번도 받지 못한 격자점만 FALLBACK_WEATHER를 돌려준다.
+    backend(backends 모듈의 저장소)를 주면 다른 레플리카가 이미 받은 슬롯은 기상청 대신 거기서 가져온다.
+    """
+
+    def __init__(self, points, client, backend=None):
+        self.points = list(points)
+        self.client = client
+        self.backend = backend
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def get(self, nx, ny):
+        """캐시된 날씨 (기다리지 않음)"""
+        entry = self._cache.get((nx, ny))
+        return entry[0] if entry else FALLBACK_WEATHER
+
+    def observed_slot(self, nx, ny):
+        """캐시된 날씨의 관측 슬롯 (base_date, base_time)"""
+        entry = self._cache.get((nx, ny))
+        return entry[1] if entry else None
+
+    def refresh(self, now=None):
+        """최신 슬롯을 아직 못 받은 격자점만 갱신, 실패한 격자점은 이전 값 유지 (실패 수 반환)"""
+        slot = resolve_base_time(now)
+        pending = [point for point in self.points if self.observed_slot(*point) != slot]
+        shared = self._load_shared(pending, slot)
+        fetched = self.client.fetch_many([point for point in pending if point not in shared], slot)
+        self._store_shared(fetched, slot)
+        with self._lock:
+            for point, weather in {**shared, **fetched}.items():
+                self._cache[point] = (weather, slot)
+        return len(pending) - len(shared) - len(fetched)
+
+    @staticmethod
+    def _shared_key(point, slot):
+        return f"nr:weather:v{SHARED_SCHEMA}:{slot[0]}{slot[1]}:{point[0]}:{point[1]}"
+
+    def _load_shared(self, points, slot):
+        results = {}
+        if self.backend is None:
+            return results
+        for point in points:
+            data = self.backend.get(self._shared_key(point, slot))
+            if data is not None:
+                weather = _decode_shared(data)
+                if weather is not None:
+                    results[point] = weather
+        return results
+
+    def _store_shared(self, results, slot):
+        if self.backend is None:
+            return
+        for point, weather in results.items():
+            self.backend.set(self._shared_key(point, slot), json.dumps(weather, ensure_ascii=False).encode("utf-8"), SHARED_TTL_SECONDS)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="weather-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                failures = self.refresh()
+            except Exception:
+                # 예상 못 한 오류로 갱신 스레드가 끝나면 프로세스가 살아 있는 동안 날씨가 멈춘다
+                _log.exception("날씨 갱신 실패, %s초 뒤 재시도", RETRY_SECONDS)
+                failures = 1
+            wait = seconds_until_refresh()
+            if failures:
+                wait = min(wait, RETRY_SECONDS)
+            self._stop.wait(wait)
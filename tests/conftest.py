@@ -0,0 +1,18 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", help="오래 걸리는 전 구간 비교 테스트도 실행")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: 전 구간 비교처럼 오래 걸리는 테스트 (--run-slow로 실행)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip = pytest.mark.skip(reason="--run-slow일 때만 실행")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,127 @@
+# --- 별자리 / 띠 / 입춘 조회 테이블 ---
+# dates.py의 표를 표 도입 전 방식, 한국천문연구원(KASI) 발표 입춘 날짜, 입춘 정의(태양 시황경 315°)와 맞춰본다.
+#
+#   python -m pytest tests/test_dates.py   # 입춘 재계산은 ephem이 있을 때만
+import datetime
+import math
+
+import pytest
+
+from fortune_engine.dates import (
+    IPCHUN_FIRST_YEAR,
+    IPCHUN_LAST_YEAR,
+    KOREAN_ZODIAC_BY_MOD12,
+    get_ipchun_date,
+    get_korean_zodiac,
+    get_zodiac_sign,
+)
+
+
+def zodiac_sign_by_ranges(day, month):
+    """표 도입 전 구간 비교 방식 그대로"""
+    md = month * 100 + day
+    if 120 <= md <= 218: return "물병자리"
+    elif 219 <= md <= 320: return "물고기자리"
+    elif 321 <= md <= 419: return "양자리"
+    elif 420 <= md <= 520: return "황소자리"
+    elif 521 <= md <= 621: return "쌍둥이자리"
+    elif 622 <= md <= 722: return "게자리"
+    elif 723 <= md <= 822: return "사자자리"
+    elif 823 <= md <= 922: return "처녀자리"
+    elif 923 <= md <= 1022: return "천칭자리"
+    elif 1023 <= md <= 1122: return "전갈자리"
+    elif 1123 <= md <= 1224: return "사수자리"
+    else: return "염소자리"
+
+
+def ipchun_date_by_rule(year):
+    """표 도입 전 입춘 규칙 그대로 (2021/2025만 3일, 1984년까지 4의 배수 해는 5일)"""
+    if year in [2021, 2025]: return datetime.date(year, 2, 3)
+    if 1920 <= year <= 1984 and (year % 4 == 0): return datetime.date(year, 2, 5)
+    return datetime.date(year, 2, 4)
+
+
+# 예전 규칙과 입춘 날짜(2월 며칠)가 달라진 해 → (예전, 지금)
+IPCHUN_CHANGED = {
+    **{year: (4, 5) for year in range(1923, 1952, 4)},
+    **{year: (4, 3) for year in (
+        2029, 2033, 2037, 2041, 2045, 2049, 2053, 2057, 2058, 2061, 2062, 2065, 2066, 2069, 2070,
+        2073, 2074, 2077, 2078, 2081, 2082, 2085, 2086, 2089, 2090, 2091, 2093, 2094, 2095, 2097,
+        2098, 2099,
+    )},
+}
+
+
+def test_zodiac_sign_matches_ranges():
+    day = datetime.date(2000, 1, 1)  # 윤년이라 2/29 포함
+    while day.year == 2000:
+        assert get_zodiac_sign(day.day, day.month) == zodiac_sign_by_ranges(day.day, day.month), day
+        day += datetime.timedelta(days=1)
+
+
+@pytest.mark.parametrize("day", [
+    datetime.date(2020, 2, 4),
+    datetime.date(2021, 2, 3),
+    datetime.date(2022, 2, 4),
+    datetime.date(2023, 2, 4),
+    datetime.date(2024, 2, 4),
+    datetime.date(2025, 2, 3),
+    datetime.date(2026, 2, 4),
+    datetime.date(2029, 2, 3),
+])
+def test_ipchun_matches_kasi(day):
+    assert get_ipchun_date(day.year) == day
+
+
+def test_ipchun_changes_from_previous_rule():
+    changed = {
+        year: (ipchun_date_by_rule(year).day, get_ipchun_date(year).day)
+        for year in range(IPCHUN_FIRST_YEAR, IPCHUN_LAST_YEAR + 1)
+        if get_ipchun_date(year) != ipchun_date_by_rule(year)
+    }
+    assert changed == IPCHUN_CHANGED
+
+
+@pytest.mark.parametrize("day, animal", [
+    (datetime.date(1923, 2, 4), "개"),      # 예전 규칙: 돼지 (입춘 2/5 전날)
+    (datetime.date(1923, 2, 5), "돼지"),
+    (datetime.date(1951, 2, 4), "호랑이"),  # 예전 규칙: 토끼
+    (datetime.date(2029, 2, 3), "닭"),      # 예전 규칙: 원숭이 (입춘 당일)
+    (datetime.date(2029, 2, 2), "원숭이"),
+])
+def test_korean_zodiac_around_changed_ipchun(day, animal):
+    assert get_korean_zodiac(day) == animal
+
+
+def test_korean_zodiac_switches_on_ipchun():
+    # 표 범위 밖 근사 구간(2월 4일)도 포함
+    for year in range(IPCHUN_FIRST_YEAR - 10, IPCHUN_LAST_YEAR + 11):
+        ipchun = get_ipchun_date(year)
+        assert get_korean_zodiac(ipchun - datetime.timedelta(days=1)) == KOREAN_ZODIAC_BY_MOD12[(year - 1) % 12]
+        assert get_korean_zodiac(ipchun) == KOREAN_ZODIAC_BY_MOD12[year % 12]
+
+
+def compute_ipchun_day(ephem, year):
+    """태양 시황경 315° 시각을 구해 한국 표준시 기준 2월 며칠인지"""
+    def longitude(t):
+        sun = ephem.Sun(t)
+        return math.degrees(ephem.Ecliptic(ephem.Equatorial(sun.ra, sun.dec, epoch=t), epoch=t).lon)
+
+    lo, hi = ephem.Date(datetime.date(year, 1, 31)), ephem.Date(datetime.date(year, 2, 8))
+    for _ in range(50):
+        mid = ephem.Date((lo + hi) / 2)
+        lo, hi = (mid, hi) if longitude(mid) < 315 else (lo, mid)
+    utc = ephem.Date(hi).datetime()
+    # 1954-03-21 ~ 1961-08-09 표준시는 UTC+8:30
+    if datetime.datetime(1954, 3, 21) <= utc < datetime.datetime(1961, 8, 10):
+        return (utc + datetime.timedelta(hours=8, minutes=30)).day
+    return (utc + datetime.timedelta(hours=9)).day
+
+
+def test_ipchun_table_matches_solar_longitude():
+    ephem = pytest.importorskip("ephem")
+    mismatched = [
+        year for year in range(IPCHUN_FIRST_YEAR, IPCHUN_LAST_YEAR + 1)
+        if compute_ipchun_day(ephem, year) != get_ipchun_date(year).day
+    ]
+    assert mismatched == []
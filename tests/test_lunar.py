@@ -0,0 +1,42 @@
+# --- 양력 → 음력 변환 테이블 ---
+# data/lunar_1920_2050.bin 조회 결과를 korean_lunar_calendar 직접 변환과 맞춰본다.
+#
+#   python -m pytest tests/test_lunar.py              # 촘촘한 표본 + 모든 윤달 (수 초)
+#   python -m pytest tests/test_lunar.py --run-slow   # 1920~2050 전 구간 (1분 넘게)
+import datetime
+
+import pytest
+
+pytest.importorskip("korean_lunar_calendar")
+
+from fortune_engine.lunar import FIRST_DATE, LAST_DATE, _convert, lunar_table, solar_to_lunar, verify_lunar_table
+
+SAMPLE_STEP = 29  # 음력 한 달보다 조금 짧게 (달마다 다른 날짜가 걸리게)
+DAY = datetime.timedelta(days=1)
+
+
+def mismatched(dates):
+    return [day for day in dates if solar_to_lunar(day) != _convert(day)]
+
+
+def test_sampled_days_match():
+    days = [FIRST_DATE + datetime.timedelta(days=i) for i in range(0, len(lunar_table()), SAMPLE_STEP)]
+    assert mismatched(days + [LAST_DATE]) == []
+
+
+def test_leap_months_match():
+    # 테이블이 윤달로 표시한 날 전부와 그 앞뒤 날 (윤달 시작/끝 경계)
+    leap_days = [FIRST_DATE + datetime.timedelta(days=i) for i, value in enumerate(lunar_table()) if value & 1]
+    assert len({solar_to_lunar(day)[:2] for day in leap_days}) > 40  # 131년에 윤달은 약 48번
+    days = sorted({d for day in leap_days for d in (day - DAY, day, day + DAY) if FIRST_DATE <= d <= LAST_DATE})
+    assert mismatched(days) == []
+
+
+def test_outside_table_falls_back():
+    for day in (FIRST_DATE - DAY, LAST_DATE + DAY):
+        assert solar_to_lunar(day) == _convert(day)
+
+
+@pytest.mark.slow
+def test_whole_range_matches():
+    assert verify_lunar_table() == []
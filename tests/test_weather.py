@@ -0,0 +1,122 @@
+# --- 기상청 클라이언트 ---
+# 표준 라이브러리 HTTP 서버로 띄운 가짜 기상청을 상대로 재시도/회로 차단/응답 처리를 확인한다.
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from fortune_engine import metrics
+from fortune_engine.weather import CircuitBreaker, CircuitOpenError, WeatherClient
+
+requests = pytest.importorskip("requests")
+
+SLOT = ("20260302", "0900")
+
+
+def observation(nx):
+    return {"response": {"header": {"resultCode": "00"}, "body": {"items": {"item": [
+        {"category": "PTY", "obsrValue": "1"},
+        {"category": "T1H", "obsrValue": str(nx)},
+    ]}}}}
+
+
+class StandInKMA:
+    """응답을 차례로 꺼내 쓰는 가짜 기상청 (다 쓰면 정상 관측값)"""
+
+    def __init__(self):
+        self.responses = []  # (상태 코드, 본문 dict 또는 None)
+        self.requests = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                stand_in.requests += 1
+                status, payload = stand_in.responses.pop(0) if stand_in.responses else (200, None)
+                if status == 200 and payload is None:
+                    payload = observation(parse_qs(urlparse(self.path).query)["nx"][0])
+                body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/getUltraSrtNcst"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def kma():
+    stand_in = StandInKMA()
+    yield stand_in
+    stand_in.close()
+
+
+def make_client(kma, **kwargs):
+    kwargs.setdefault("backoff", 0.001)
+    return WeatherClient("test-key", base_url=kma.url, **kwargs)
+
+
+def test_fetch_parses_observation(kma):
+    assert make_client(kma).fetch(60, 127, SLOT) == ("☔", "60℃", "비")
+
+
+def test_fetch_retries_server_errors(kma):
+    kma.responses = [(503, None), (503, None)]
+    client = make_client(kma, retries=2)
+    assert client.fetch(58, 126, SLOT) == ("☔", "58℃", "비")
+    assert kma.requests == 3
+    assert not client.breaker.is_open
+
+
+def test_fetch_does_not_retry_client_errors(kma):
+    kma.responses = [(401, {"error": "SERVICE_KEY_IS_NOT_REGISTERED_ERROR"})]
+    client = make_client(kma, retries=2, breaker=CircuitBreaker(failure_threshold=1))
+    with pytest.raises(requests.HTTPError):
+        client.fetch(58, 126, SLOT)
+    assert kma.requests == 1
+    assert not client.breaker.is_open
+
+
+def test_fetch_counts_error_body_as_failure(kma):
+    metrics.reset()
+    kma.responses = [(200, {"response": {"header": {"resultCode": "30", "resultMsg": "SERVICE_KEY_IS_NOT_REGISTERED"}}})]
+    client = make_client(kma, breaker=CircuitBreaker(failure_threshold=1))
+    with pytest.raises(ValueError):
+        client.fetch(58, 126, SLOT)
+    assert client.breaker.is_open
+    assert 'nunchi_events_total{event="kma_parse_error"} 1' in metrics.render_prometheus()
+
+
+def test_breaker_opens_and_recovers(kma):
+    kma.responses = [(503, None), (503, None)]
+    client = make_client(kma, retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=0.2))
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.fetch(58, 126, SLOT)
+    with pytest.raises(CircuitOpenError):
+        client.fetch(58, 126, SLOT)
+    assert kma.requests == 2  # 열린 동안은 보내지 않는다
+
+    time.sleep(0.25)
+    assert client.fetch(58, 126, SLOT) == ("☔", "58℃", "비")  # 시험 요청 성공 → 닫힘
+    assert not client.breaker.is_open
+
+
+def test_fetch_many_skips_failed_points(kma):
+    kma.responses = [(503, None)]
+    results = make_client(kma, retries=0, max_workers=1).fetch_many([(1, 1), (2, 2)], SLOT)
+    assert len(results) == 1